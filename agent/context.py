@@ -1,4 +1,5 @@
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 
 class TaskContext:
@@ -7,8 +8,11 @@ class TaskContext:
     Used for configuration, shared state, and future AI memory.
     """
 
+    __slots__ = ("_data", "_view")
+
     def __init__(self):
         self._data: Dict[str, Any] = {}
+        self._view = MappingProxyType(self._data)
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -22,8 +26,9 @@ class TaskContext:
         """
         return self._data.get(key, default)
 
-    def all(self) -> Dict[str, Any]:
+    def all(self) -> Mapping[str, Any]:
         """
-        Return full context data.
+        Return a read-only live view of the full context data.
+        Use dict(context.all()) for a mutable snapshot.
         """
-        return dict(self._data)
+        return self._view
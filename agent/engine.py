@@ -20,22 +20,31 @@ class AgentEngine:
         """
         try:
             task = self.registry.get(task_name)
+        except KeyError as e:
+            return TaskResult(
+                status=TaskStatus.FAILED,
+                message=f"Task '{task_name}' is not registered",
+                error=e.args[0]
+            )
 
-            # Mark task as running
+        try:
             result = task.execute(self.context)
-
-            if not isinstance(result, TaskResult):
-                return TaskResult(
-                    status=TaskStatus.FAILED,
-                    message=f"Task '{task_name}' did not return TaskResult",
-                    error="Invalid return type"
-                )
-
-            return result
-
         except Exception as e:
             return TaskResult(
                 status=TaskStatus.FAILED,
                 message=f"Task '{task_name}' crashed during execution",
                 error=str(e)
             )
+
+        # Exact-type check first; isinstance only for subclasses
+        if type(result) is TaskResult:
+            return result
+
+        if not isinstance(result, TaskResult):
+            return TaskResult(
+                status=TaskStatus.FAILED,
+                message=f"Task '{task_name}' did not return TaskResult",
+                error="Invalid return type"
+            )
+
+        return result
@@ -1,11 +1,64 @@
+import atexit
 import logging
+import queue
+from logging.handlers import (
+    MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+)
 from pathlib import Path
+from typing import Optional
+
+# Configured once, then reused by every caller
+_agent_logger: Optional[logging.Logger] = None
+
+# User-space write buffer for the log file
+LOG_BUFFER_SIZE = 64 * 1024
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that writes through a 64 KiB buffer.
+
+    StreamHandler.emit flushes after every record, which turns each log
+    line into its own write() syscall. emit() here writes to the buffered
+    stream without that flush; the buffer reaches the OS when it fills,
+    on ERROR records, on rollover and on an explicit flush().
+    """
+
+    def _open(self):
+        return open(
+            self.baseFilename, self.mode,
+            buffering=LOG_BUFFER_SIZE,
+            encoding=self.encoding, errors=self.errors
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # RotatingFileHandler.emit + StreamHandler.emit, minus the
+        # per-record flush (handle() already holds self.lock)
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 def get_agent_logger() -> logging.Logger:
     """
     Central logger for the automation agent.
+
+    Records are handed to a background listener through a queue and
+    batched in memory before being written, so callers never block on
+    file I/O. ERROR records flush the buffer immediately.
     """
+    global _agent_logger
+    if _agent_logger is not None:
+        return _agent_logger
 
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
@@ -14,11 +67,32 @@ def get_agent_logger() -> logging.Logger:
     logger.setLevel(logging.INFO)
 
     if not logger.handlers:
-        handler = logging.FileHandler(log_dir / "agent.log")
+        file_handler = BufferedRotatingFileHandler(
+            log_dir / "agent.log",
+            maxBytes=50 * 1024 * 1024,
+            backupCount=10,
+            encoding="utf-8"
+        )
         formatter = logging.Formatter(
             "%(asctime)s | %(levelname)s | %(message)s"
         )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        file_handler.setFormatter(formatter)
+
+        buffered = MemoryHandler(
+            capacity=512,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
+
+        listener = QueueListener(queue.Queue(), buffered)
+        listener.start()
+        # atexit runs these last-registered first: drain the queue, hand
+        # the buffered records to the file, then flush the file buffer
+        atexit.register(file_handler.flush)
+        atexit.register(buffered.flush)
+        atexit.register(listener.stop)
+
+        logger.addHandler(QueueHandler(listener.queue))
 
+    _agent_logger = logger
     return logger
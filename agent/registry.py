@@ -1,4 +1,5 @@
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping
 from agent.core import Task
 
 
@@ -9,6 +10,7 @@ class TaskRegistry:
 
     def __init__(self):
         self._tasks: Dict[str, Task] = {}
+        self._view = MappingProxyType(self._tasks)
 
     def register(self, task: Task) -> None:
         """
@@ -22,12 +24,13 @@ class TaskRegistry:
         """
         Get a task by name.
         """
-        if name not in self._tasks:
-            raise KeyError(f"Task '{name}' not found")
-        return self._tasks[name]
+        try:
+            return self._tasks[name]
+        except KeyError:
+            raise KeyError(f"Task '{name}' not found") from None
 
-    def all_tasks(self) -> Dict[str, Task]:
+    def all_tasks(self) -> Mapping[str, Task]:
         """
-        Return all registered tasks.
+        Return a read-only live view of all registered tasks.
         """
-        return dict(self._tasks)
+        return self._view
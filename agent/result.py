@@ -1,6 +1,8 @@
+import sys
+import time
 from enum import Enum
 from typing import Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 class TaskStatus(Enum):
@@ -13,11 +15,17 @@ class TaskStatus(Enum):
     FAILED = "FAILED"
 
 
+# Interned status strings, so to_dict skips the Enum .value descriptor
+_STATUS_STR = {status: sys.intern(status.value) for status in TaskStatus}
+
+
 class TaskResult:
     """
     Standard result object returned by every task.
     """
 
+    __slots__ = ("status", "message", "data", "error", "timestamp_ns")
+
     def __init__(
         self,
         status: TaskStatus,
@@ -29,7 +37,18 @@ class TaskResult:
         self.message = message
         self.data = data
         self.error = error
-        self.timestamp = datetime.utcnow()
+        # Raw epoch nanoseconds; converted to a datetime only on demand
+        self.timestamp_ns = time.time_ns()
+
+    @property
+    def timestamp(self) -> datetime:
+        """
+        Creation time as a naive UTC datetime (as datetime.utcnow() gives).
+        """
+        seconds, nanos = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(
+            microsecond=nanos // 1000, tzinfo=None
+        )
 
     def is_success(self) -> bool:
         """
@@ -42,7 +61,7 @@ class TaskResult:
         Convert result to dictionary (API / log / DB ready).
         """
         return {
-            "status": self.status.value,
+            "status": _STATUS_STR[self.status],
             "message": self.message,
             "data": self.data,
             "error": self.error,
@@ -1,9 +1,111 @@
+import re
 from datetime import datetime
+from functools import lru_cache
 from ai.llm_client import LLMClient
 from ai.memory import MemorySystem
 from ai.profile import UserProfile
 
 
+# -------------------------
+# INTENT KEYWORD TABLES
+# -------------------------
+_GREETINGS = frozenset({
+    "hi", "hello", "hey", "hii", "hola",
+    "good morning", "good afternoon", "good evening"
+})
+
+# Checked in priority order - the first bucket with a matching phrase wins
+_INTENT_PHRASES = (
+    ("identity", ("what is your name", "your name", "who are you", "what are you")),
+    ("about_user", ("who am i", "what do you know about me", "my profile", "what's my name")),
+    ("how_are_you", ("how are you", "how do you do", "how's it going", "what's up")),
+    ("capabilities", ("what can you do", "help me", "capabilities", "can you help")),
+    ("status", ("status", "health", "are you online", "working", "operational")),
+    ("tasks", ("task", "tasks", "available", "what tasks", "how many")),
+    ("thanks", ("thank you", "thanks", "thx", "appreciate")),
+    ("goodbye", ("bye", "goodbye", "see you", "exit", "quit")),
+)
+
+# One lookahead per bucket, tried in order, so a single match() both
+# preserves the priority above and reports the winner via lastgroup
+_INTENT_RE = re.compile(
+    "|".join(
+        f"(?=.*?(?P<{tag}>{'|'.join(re.escape(p) for p in phrases)}))"
+        for tag, phrases in _INTENT_PHRASES
+    ),
+    re.DOTALL
+)
+
+# Any phrase that could lead _learn_from_input to store something
+_LEARN_TRIGGER_RE = re.compile("|".join(re.escape(p) for p in (
+    "my name is", "i'm", "i am", "call me",
+    "i like", "i love", "i prefer", "i enjoy",
+    "i don't like", "i hate", "i dislike",
+    "i live in", "i'm from", "i am from",
+    "i work as", "i'm a", "i am a", "my job",
+    "i know", "i can", "i'm good at",
+)))
+
+
+def _ordered_capture(phrases, payload: str) -> re.Pattern:
+    """
+    Compile "<phrase> <payload>" alternatives that match() tries in the
+    given order, so earlier phrases keep priority wherever they occur.
+    The captured payload is match.group(match.lastindex).
+    """
+    return re.compile(
+        "|".join(f"(?=.*?\\b{re.escape(p)}\\s+({payload}))" for p in phrases),
+        re.DOTALL
+    )
+
+
+def _extract(pattern: re.Pattern, text: str) -> str:
+    """Return the trimmed payload captured by an _ordered_capture pattern."""
+    match = pattern.match(text)
+    if not match:
+        return ""
+    return match.group(match.lastindex).strip('.,!?')
+
+
+# A name is a single alphabetic word of 2+ letters, trailing punctuation allowed
+_NAME_RE = _ordered_capture(
+    ("my name is", "i'm", "i am", "call me"),
+    r"[^\W\d_]{2,}(?=[.,!?]*(?:\s|$))"
+)
+_LIKE_RE = _ordered_capture(("i like", "i love", "i prefer", "i enjoy"), ".+")
+_DISLIKE_RE = _ordered_capture(("i don't like", "i hate", "i dislike"), ".+")
+_LOCATION_RE = _ordered_capture(("i live in", "i'm from", "i am from"), ".+")
+_JOB_RE = _ordered_capture(("i work as", "i'm a", "i am a"), ".+")
+_SKILL_RE = _ordered_capture(("i know", "i can", "i'm good at"), ".+")
+
+
+
+@lru_cache(maxsize=128)
+def _greeting_text(greet: str, display_name, established: bool) -> str:
+    """Build the greeting for a time-of-day / name / relationship combination."""
+    if display_name is None:
+        # First time or name not set
+        return (
+            f"{greet}! 👋\n"
+            f"I'm ARES, your personal AI assistant.\n"
+            f"I'd love to get to know you! What's your name?"
+        )
+
+    if not established:
+        # Still getting to know each other
+        return (
+            f"{greet}, {display_name}! 👋\n"
+            f"Great to see you again! I'm ARES, your personal AI assistant.\n"
+            f"How can I help you today?"
+        )
+
+    # Established relationship
+    return (
+        f"{greet}, {display_name}! 👋\n"
+        f"Ready to assist you. What's on your mind?"
+    )
+
+
 class AIBrain:
     """
     ARES AI Brain with Complete Memory & Personalization
@@ -17,7 +119,7 @@ class AIBrain:
     def __init__(self):
         self.llm = LLMClient()
         self.memory = MemorySystem()
-        self.profile = UserProfile()
+        self.profile = UserProfile(self.memory)
         
         # Quick access to user name
         self.user_name = self.profile.get_name()
@@ -33,42 +135,17 @@ class AIBrain:
     # -------------------------
     def _greeting(self):
         hour = datetime.now().hour
-
-        if hour < 12:
-            greet = "Good morning"
-        elif hour < 18:
-            greet = "Good afternoon"
-        else:
-            greet = "Good evening"
+        greet = "Good morning" if hour < 12 else "Good afternoon" if hour < 18 else "Good evening"
 
         # Personalized greeting based on user profile
+        display_name = None
+        established = False
         if self.user_name:
-            nickname = self.profile.get_nickname()
-            display_name = nickname if nickname else self.user_name
-            
+            display_name = self.profile.get_nickname() or self.user_name
             # Check conversation count for relationship building
-            convo_count = self.profile.get_conversation_count()
-            
-            if convo_count < 5:
-                # Still getting to know each other
-                return (
-                    f"{greet}, {display_name}! 👋\n"
-                    f"Great to see you again! I'm ARES, your personal AI assistant.\n"
-                    f"How can I help you today?"
-                )
-            else:
-                # Established relationship
-                return (
-                    f"{greet}, {display_name}! 👋\n"
-                    f"Ready to assist you. What's on your mind?"
-                )
-        else:
-            # First time or name not set
-            return (
-                f"{greet}! 👋\n"
-                f"I'm ARES, your personal AI assistant.\n"
-                f"I'd love to get to know you! What's your name?"
-            )
+            established = self.profile.get_conversation_count() >= 5
+
+        return _greeting_text(greet, display_name, established)
 
     def think(self, user_input: str) -> dict:
         """
@@ -81,7 +158,7 @@ class AIBrain:
         self._learn_from_input(user_input)
 
         # 🔹 Instant greeting (NO LLM)
-        if text in ["hi", "hello", "hey", "hii", "hola", "good morning", "good afternoon", "good evening"]:
+        if text in _GREETINGS:
             # Increment conversation count
             self.profile.increment_conversation_count()
             
@@ -91,75 +168,87 @@ class AIBrain:
                 "confidence": 1.0
             }
 
-        # 🔹 Identity questions
-        if any(phrase in text for phrase in ["what is your name", "your name", "who are you", "what are you"]):
-            return {
-                "intent": "CHAT",
-                "reply": self._introduce_self(),
-                "confidence": 1.0
-            }
+        # 🔹 Keyword intents (identity, status, thanks, ...)
+        match = _INTENT_RE.match(text)
+        if match:
+            return self._INTENT_HANDLERS[match.lastgroup](self)
 
-        # 🔹 User asking about themselves
-        if any(phrase in text for phrase in ["who am i", "what do you know about me", "my profile", "what's my name"]):
-            return {
-                "intent": "CHAT",
-                "reply": self._tell_about_user(),
-                "confidence": 1.0
-            }
+        # 🔹 For everything else, use conversational AI with memory
+        return {
+            "intent": "CHAT",
+            "confidence": 0.5
+        }
+    
+    # -------------------------
+    # KEYWORD INTENT HANDLERS
+    # -------------------------
+    def _on_identity(self) -> dict:
+        return {
+            "intent": "CHAT",
+            "reply": self._introduce_self(),
+            "confidence": 1.0
+        }
 
-        # 🔹 How are you / Status
-        if any(phrase in text for phrase in ["how are you", "how do you do", "how's it going", "what's up"]):
-            return {
-                "intent": "CHAT",
-                "reply": self._status_response(),
-                "confidence": 1.0
-            }
+    def _on_about_user(self) -> dict:
+        return {
+            "intent": "CHAT",
+            "reply": self._tell_about_user(),
+            "confidence": 1.0
+        }
 
-        # 🔹 Ask capabilities
-        if "what can you do" in text or "help me" in text or "capabilities" in text or "can you help" in text:
-            return {
-                "intent": "CAPABILITIES",
-                "confidence": 1.0
-            }
+    def _on_how_are_you(self) -> dict:
+        return {
+            "intent": "CHAT",
+            "reply": self._status_response(),
+            "confidence": 1.0
+        }
 
-        # 🔹 Status queries
-        if any(word in text for word in ["status", "health", "are you online", "working", "operational"]):
-            return {
-                "intent": "STATUS",
-                "confidence": 0.9
-            }
+    def _on_capabilities(self) -> dict:
+        return {
+            "intent": "CAPABILITIES",
+            "confidence": 1.0
+        }
 
-        # 🔹 Task queries
-        if any(word in text for word in ["task", "tasks", "available", "what tasks", "how many"]):
-            return {
-                "intent": "STATUS",
-                "confidence": 0.8
-            }
+    def _on_status(self) -> dict:
+        return {
+            "intent": "STATUS",
+            "confidence": 0.9
+        }
 
-        # 🔹 Thank you responses
-        if any(phrase in text for phrase in ["thank you", "thanks", "thx", "appreciate"]):
-            name_part = f", {self.user_name}" if self.user_name else ""
-            return {
-                "intent": "CHAT",
-                "reply": f"You're welcome{name_part}! Let me know if you need anything else.",
-                "confidence": 1.0
-            }
+    def _on_tasks(self) -> dict:
+        return {
+            "intent": "STATUS",
+            "confidence": 0.8
+        }
 
-        # 🔹 Goodbye
-        if any(word in text for word in ["bye", "goodbye", "see you", "exit", "quit"]):
-            name_part = f", {self.user_name}" if self.user_name else ""
-            return {
-                "intent": "CHAT",
-                "reply": f"Goodbye{name_part}! I'll be here whenever you need me. Have a great day!",
-                "confidence": 1.0
-            }
+    def _on_thanks(self) -> dict:
+        name_part = f", {self.user_name}" if self.user_name else ""
+        return {
+            "intent": "CHAT",
+            "reply": f"You're welcome{name_part}! Let me know if you need anything else.",
+            "confidence": 1.0
+        }
 
-        # 🔹 For everything else, use conversational AI with memory
+    def _on_goodbye(self) -> dict:
+        name_part = f", {self.user_name}" if self.user_name else ""
         return {
             "intent": "CHAT",
-            "confidence": 0.5
+            "reply": f"Goodbye{name_part}! I'll be here whenever you need me. Have a great day!",
+            "confidence": 1.0
         }
-    
+
+    # _INTENT_RE group name -> handler
+    _INTENT_HANDLERS = {
+        "identity": _on_identity,
+        "about_user": _on_about_user,
+        "how_are_you": _on_how_are_you,
+        "capabilities": _on_capabilities,
+        "status": _on_status,
+        "tasks": _on_tasks,
+        "thanks": _on_thanks,
+        "goodbye": _on_goodbye,
+    }
+
     def _introduce_self(self) -> str:
         """Introduce ARES to the user"""
         return (
@@ -261,7 +350,7 @@ class AIBrain:
         if memory_context:
             full_context += memory_context
         
-        # Try LLM with full context
+        # Try LLM with full context (plain chat when nothing is known yet)
         response = self.llm.chat_with_context(user_input, full_context)
         
         # Save conversation to memory
@@ -289,71 +378,51 @@ class AIBrain:
         Updates both Profile and Memory systems.
         """
         text = user_input.lower().strip()
+
+        # Most messages carry nothing personal - skip all category scans
+        if not _LEARN_TRIGGER_RE.search(text):
+            return
         
         # Learn user's name
-        if any(phrase in text for phrase in ["my name is", "i'm", "i am", "call me"]):
-            # Extract name
-            for phrase in ["my name is ", "i'm ", "i am ", "call me "]:
-                if phrase in text:
-                    parts = text.split(phrase, 1)
-                    if len(parts) > 1:
-                        potential_name = parts[1].split()[0].strip('.,!?')
-                        # Capitalize first letter
-                        name = potential_name.capitalize()
-                        if len(name) > 1 and name.isalpha():
-                            self.profile.set_name(name)
-                            self.user_name = name
-                            break
-        
+        match = _NAME_RE.match(text)
+        if match:
+            name = match.group(match.lastindex).capitalize()
+            self.profile.set_name(name)
+            self.user_name = name
+
         # Learn preferences - likes
-        if any(phrase in text for phrase in ["i like", "i love", "i prefer", "i enjoy"]):
-            for phrase in ["i like ", "i love ", "i prefer ", "i enjoy "]:
-                if phrase in text:
-                    parts = text.split(phrase, 1)
-                    if len(parts) > 1:
-                        preference = parts[1].strip('.,!?')
-                        self.profile.add_interest(preference)
-                        self.memory.learn_preference('likes', preference, confidence=0.9)
-                        break
-        
+        preference = _extract(_LIKE_RE, text)
+        if preference:
+            self.profile.add_interest(preference)
+            self.memory.learn_preference('likes', preference, confidence=0.9)
+
         # Learn preferences - dislikes
-        if any(phrase in text for phrase in ["i don't like", "i hate", "i dislike"]):
-            for phrase in ["i don't like ", "i hate ", "i dislike "]:
-                if phrase in text:
-                    parts = text.split(phrase, 1)
-                    if len(parts) > 1:
-                        dislike = parts[1].strip('.,!?')
-                        self.memory.learn_preference('dislikes', dislike, confidence=0.9)
-                        break
-        
+        dislike = _extract(_DISLIKE_RE, text)
+        if dislike:
+            self.memory.learn_preference('dislikes', dislike, confidence=0.9)
+
         # Learn location
-        if any(phrase in text for phrase in ["i live in", "i'm from", "i am from"]):
-            for phrase in ["i live in ", "i'm from ", "i am from "]:
-                if phrase in text:
-                    parts = text.split(phrase, 1)
-                    if len(parts) > 1:
-                        location = parts[1].strip('.,!?')
-                        self.profile.set_location(location)
-                        self.memory.set_user_info('location', location)
-                        break
-        
+        location = _extract(_LOCATION_RE, text)
+        if location:
+            self.profile.set_location(location)
+            self.memory.set_user_info('location', location)
+
         # Learn profession
-        if any(phrase in text for phrase in ["i work as", "i'm a", "i am a", "my job"]):
-            for phrase in ["i work as ", "i'm a ", "i am a "]:
-                if phrase in text:
-                    parts = text.split(phrase, 1)
-                    if len(parts) > 1:
-                        job = parts[1].strip('.,!?')
-                        self.profile.set_occupation(job)
-                        self.memory.set_user_info('profession', job)
-                        break
-        
+        job = _extract(_JOB_RE, text)
+        if job:
+            self.profile.set_occupation(job)
+            self.memory.set_user_info('profession', job)
+
         # Learn skills
-        if any(phrase in text for phrase in ["i know", "i can", "i'm good at"]):
-            for phrase in ["i know ", "i can ", "i'm good at "]:
-                if phrase in text:
-                    parts = text.split(phrase, 1)
-                    if len(parts) > 1:
-                        skill = parts[1].strip('.,!?')
-                        self.profile.add_skill(skill)
-                        break
\ No newline at end of file
+        skill = _extract(_SKILL_RE, text)
+        if skill:
+            self.profile.add_skill(skill)
+
+
+@lru_cache(maxsize=1)
+def get_brain() -> AIBrain:
+    """
+    Shared AIBrain for the process, so every caller uses the same
+    memory database and profile instead of loading its own copy.
+    """
+    return AIBrain()
@@ -1,10 +1,97 @@
 import json
-import yaml
-import requests
+from functools import lru_cache
 from pathlib import Path
 
 CONFIG_PATH = Path("config/llm.yaml")
 
+# requests and yaml are imported on first use, so importing this module
+# (e.g. for greeting-only paths) does not pay for them
+
+
+@lru_cache(maxsize=1)
+def _get_session():
+    """
+    Shared keep-alive session so every Ollama call reuses pooled connections.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    return session
+
+
+# -------------------------
+# PROMPT TEMPLATES
+# -------------------------
+# Static scaffolding is built once; per call only the user text (and
+# context) is spliced in.
+_CLASSIFY_PROMPT = """
+Classify intent. Respond ONLY in JSON.
+
+INTENTS:
+RUN_TASK, CHAT, STATUS, CAPABILITIES, UNKNOWN
+
+JSON:
+{"intent":"","task":null,"confidence":0.0}
+
+User: """
+
+_CONTEXT_CHAT_HEAD = """
+You are ARES, a friendly AI assistant.
+
+"""
+
+_CONTEXT_CHAT_RULES = """
+
+Rules:
+- Use the user information above to personalize your responses
+- Be natural and polite
+- Keep answers SHORT unless user asks for detail
+- If greeting, use their name if you know it
+- Remember their preferences and mention them when relevant
+- Avoid long lectures
+
+User: """
+
+_CHAT_PROMPT = """
+You are ARES, a friendly AI assistant.
+
+Rules:
+- Be natural and polite
+- Keep answers SHORT unless user asks for detail
+- If greeting, reply briefly
+- If coding, give full code
+- Avoid long lectures
+
+User: """
+
+_PROMPT_TAIL = """
+ARES:
+"""
+
+# orjson is optional; fall back to the stdlib codec when it is missing
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+@lru_cache(maxsize=1)
+def _load_config():
+    """Read and parse config/llm.yaml once per process (None if missing)."""
+    if not CONFIG_PATH.exists():
+        return None
+
+    import yaml
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(CONFIG_PATH.read_text(), Loader=loader)
+
 
 class LLMClient:
     """
@@ -14,8 +101,9 @@ class LLMClient:
 
     def __init__(self):
         try:
-            if CONFIG_PATH.exists():
-                self.config = yaml.safe_load(CONFIG_PATH.read_text())
+            config = _load_config()
+            if config is not None:
+                self.config = config
                 self.base_url = self.config["ollama"]["base_url"]
                 self.model = self.config["ollama"]["model"]
             else:
@@ -27,41 +115,51 @@ class LLMClient:
             self.base_url = "http://localhost:11434"
             self.model = "llama3"
 
-    # -------------------------
-    # INTENT CLASSIFIER (FAST)
-    # -------------------------
-    def classify_intent(self, command: str) -> dict:
-        prompt = f"""
-Classify intent. Respond ONLY in JSON.
-
-INTENTS:
-RUN_TASK, CHAT, STATUS, CAPABILITIES, UNKNOWN
-
-JSON:
-{{"intent":"","task":null,"confidence":0.0}}
+        self.generate_url = f"{self.base_url}/api/generate"
 
-User: {command}
-"""
+    def _generate(self, payload: dict, timeout: int) -> str:
+        """
+        POST a payload to Ollama's /api/generate and return the stripped
+        "response" text. Request and response bodies go through orjson
+        when it is installed. Timeouts and connection failures are raised
+        as the builtin TimeoutError / ConnectionError.
+        """
+        session = _get_session()
+        from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
 
         try:
-            r = requests.post(
-                f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.0,
-                        "num_ctx": 1024
-                    }
-                },
-                timeout=20
+            r = session.post(
+                self.generate_url,
+                data=_json_dumps(payload),
+                headers=_JSON_HEADERS,
+                timeout=timeout
             )
+        except Timeout as e:
+            raise TimeoutError(str(e)) from e
+        except RequestsConnectionError as e:
+            raise ConnectionError(str(e)) from e
+
+        r.raise_for_status()
+        return _json_loads(r.content).get("response", "").strip()
 
-            r.raise_for_status()
-            raw = r.json().get("response", "").strip()
+    # -------------------------
+    # INTENT CLASSIFIER (FAST)
+    # -------------------------
+    def classify_intent(self, command: str) -> dict:
+        prompt = _CLASSIFY_PROMPT + command + "\n"
 
-            return json.loads(raw) if raw else {"intent": "CHAT", "confidence": 0.0}
+        try:
+            raw = self._generate({
+                "model": self.model,
+                "prompt": prompt,
+                "stream": False,
+                "options": {
+                    "temperature": 0.0,
+                    "num_ctx": 1024
+                }
+            }, timeout=20)
+
+            return _json_loads(raw) if raw else {"intent": "CHAT", "confidence": 0.0}
 
         except Exception:
             return {"intent": "CHAT", "confidence": 0.0}
@@ -75,49 +173,27 @@ User: {command}
         """
         # Build prompt with context
         if context:
-            prompt = f"""
-You are ARES, a friendly AI assistant.
-
-{context}
-
-Rules:
-- Use the user information above to personalize your responses
-- Be natural and polite
-- Keep answers SHORT unless user asks for detail
-- If greeting, use their name if you know it
-- Remember their preferences and mention them when relevant
-- Avoid long lectures
-
-User: {command}
-ARES:
-"""
+            prompt = "".join((_CONTEXT_CHAT_HEAD, context, _CONTEXT_CHAT_RULES, command, _PROMPT_TAIL))
         else:
             # Fallback to regular chat if no context
             return self.chat(command)
 
         try:
-            r = requests.post(
-                f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.3,
-                        "num_ctx": 3072,  # Increased for context
-                        "top_p": 0.9
-                    }
-                },
-                timeout=40
-            )
-
-            r.raise_for_status()
-            return r.json().get("response", "").strip()
-
-        except requests.exceptions.Timeout:
+            return self._generate({
+                "model": self.model,
+                "prompt": prompt,
+                "stream": False,
+                "options": {
+                    "temperature": 0.3,
+                    "num_ctx": 3072,  # Increased for context
+                    "top_p": 0.9
+                }
+            }, timeout=40)
+
+        except TimeoutError:
             return "Sorry, I'm taking a bit longer than usual. Please try again."
 
-        except requests.exceptions.ConnectionError:
+        except ConnectionError:
             return "I'm having trouble connecting to my AI brain. Please make sure Ollama is running (ollama serve)."
 
         except Exception as e:
@@ -127,44 +203,25 @@ ARES:
     # CHAT MODE (HUMAN STYLE)
     # -------------------------
     def chat(self, command: str) -> str:
-        prompt = f"""
-You are ARES, a friendly AI assistant.
-
-Rules:
-- Be natural and polite
-- Keep answers SHORT unless user asks for detail
-- If greeting, reply briefly
-- If coding, give full code
-- Avoid long lectures
-
-User: {command}
-ARES:
-"""
+        prompt = _CHAT_PROMPT + command + _PROMPT_TAIL
 
         try:
-            r = requests.post(
-                f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.3,
-                        "num_ctx": 2048,
-                        "top_p": 0.9
-                    }
-                },
-                timeout=40
-            )
-
-            r.raise_for_status()
-            return r.json().get("response", "").strip()
-
-        except requests.exceptions.Timeout:
+            return self._generate({
+                "model": self.model,
+                "prompt": prompt,
+                "stream": False,
+                "options": {
+                    "temperature": 0.3,
+                    "num_ctx": 2048,
+                    "top_p": 0.9
+                }
+            }, timeout=40)
+
+        except TimeoutError:
             return "Sorry, I'm taking a bit longer than usual. Please try again."
 
-        except requests.exceptions.ConnectionError:
+        except ConnectionError:
             return "I'm having trouble connecting to my AI brain. Please make sure Ollama is running (ollama serve)."
 
         except Exception as e:
-            return f"Something went wrong: {str(e)}"
\ No newline at end of file
+            return f"Something went wrong: {str(e)}"
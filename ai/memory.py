@@ -1,8 +1,130 @@
+import atexit
 import json
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+# orjson is optional; profile field values fall back to the stdlib codec
+try:
+    import orjson
+    
+    def _encode_value(value: Any) -> str:
+        return orjson.dumps(value).decode("utf-8")
+    
+    _decode_value = orjson.loads
+except ImportError:
+    def _encode_value(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    
+    _decode_value = json.loads
+
+
+# =====================================
+# SQL STATEMENTS
+# =====================================
+# Built once at import; the connection's statement cache keeps them
+# prepared across calls.
+
+# UPSERTs update in place (no delete + reinsert) and let SQLite stamp the time
+_SQL_UPSERT_PROFILE = """
+    INSERT INTO user_profile (key, value)
+    VALUES (?, ?)
+    ON CONFLICT (key) DO UPDATE SET
+        value = excluded.value,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+_SQL_PROFILE_VALUE = "SELECT value FROM user_profile WHERE key = ?"
+
+_SQL_FULL_PROFILE = "SELECT key, value FROM user_profile"
+
+_SQL_PROFILE_FIELDS = "SELECT key, value FROM profile_fields"
+
+_SQL_UPSERT_PROFILE_FIELD = """
+    INSERT INTO profile_fields (key, value)
+    VALUES (?, ?)
+    ON CONFLICT (key) DO UPDATE SET value = excluded.value
+"""
+
+_SQL_INSERT_CONVERSATION = """
+    INSERT INTO conversations (user_message, ares_response, context_used)
+    VALUES (?, ?, ?)
+"""
+
+# Newest N by primary key, handed back oldest-first (chronological)
+_SQL_RECENT_CONVERSATIONS = """
+    SELECT timestamp, user_message AS user, ares_response AS ares
+    FROM (
+        SELECT id, timestamp, user_message, ares_response
+        FROM conversations
+        ORDER BY id DESC
+        LIMIT ?
+    )
+    ORDER BY id
+"""
+
+_SQL_SEARCH_CONVERSATIONS_FTS = """
+    SELECT c.timestamp, c.user_message AS user, c.ares_response AS ares
+    FROM conversations_fts f
+    JOIN conversations c ON c.id = f.rowid
+    WHERE conversations_fts MATCH ?
+    ORDER BY f.rank
+    LIMIT ?
+"""
+
+# Fallback without FTS5: plain substring test, so % and _ in the keyword
+# are literal (?1 = lowercased keyword, ?2 = limit)
+_SQL_SEARCH_CONVERSATIONS_SCAN = """
+    SELECT timestamp, user_message AS user, ares_response AS ares
+    FROM conversations
+    WHERE instr(lower(user_message), ?1) > 0 OR instr(lower(ares_response), ?1) > 0
+    ORDER BY id DESC
+    LIMIT ?2
+"""
+
+_SQL_UPSERT_PREFERENCE = """
+    INSERT INTO preferences (category, preference, confidence)
+    VALUES (?, ?, ?)
+    ON CONFLICT (category, preference) DO UPDATE SET
+        confidence = excluded.confidence,
+        learned_at = CURRENT_TIMESTAMP
+"""
+
+_SQL_PREFERENCES_BY_CATEGORY = """
+    SELECT category, preference FROM preferences
+    WHERE category = ?
+    ORDER BY confidence DESC
+"""
+
+_SQL_ALL_PREFERENCES = """
+    SELECT category, preference FROM preferences
+    ORDER BY category, confidence DESC
+"""
+
+# A repeated fact is refreshed rather than stored again, keeping its
+# highest importance
+_SQL_UPSERT_FACT = """
+    INSERT INTO facts (fact, category, importance)
+    VALUES (?, ?, ?)
+    ON CONFLICT (fact, category) DO UPDATE SET
+        importance = MAX(importance, excluded.importance),
+        created_at = CURRENT_TIMESTAMP
+"""
+
+_SQL_FACTS_BY_CATEGORY = """
+    SELECT fact FROM facts
+    WHERE category = ?
+    ORDER BY importance DESC, created_at DESC
+    LIMIT ?
+"""
+
+_SQL_TOP_FACTS = """
+    SELECT fact FROM facts
+    ORDER BY importance DESC, created_at DESC
+    LIMIT ?
+"""
 
 
 class MemorySystem:
@@ -11,65 +133,291 @@ class MemorySystem:
     
     Stores:
     - User profile (name, preferences, interests)
+    - Structured profile fields backing ai.profile.UserProfile
     - Conversation history
     - Learned preferences
     - Important facts about the user
+    
+    Writes go through a single autocommit connection, reads through a
+    second read-only (query_only) connection, each opened once and
+    guarded by its own lock, so under WAL reads and exports don't queue
+    behind writes. Connections (and the schema setup) are deferred until
+    the first read or write.
     """
     
+    # Per-connection tuning applied once when the connection is opened
+    CONNECTION_PRAGMAS = (
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-64000",
+        "PRAGMA busy_timeout=5000",
+    )
+    
     def __init__(self, db_path: str = "data/ares_memory.db"):
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.init_database()
+        self.in_memory = str(db_path) == ":memory:"
+        if not self.in_memory:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._lock = threading.RLock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._read_lock = threading.RLock()
+        self._reader: Optional[sqlite3.Connection] = None
+        self._close_registered = False
+    
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """The shared connection, opened and initialized on first use."""
+        if self._connection is None:
+            with self._lock:
+                if self._connection is None:
+                    self._connection = self._connect()
+                    try:
+                        self.init_database()
+                    except Exception:
+                        self._connection.close()
+                        self._connection = None
+                        raise
+                    # Run PRAGMA optimize and close cleanly at exit if no
+                    # one calls close() first
+                    if not self._close_registered:
+                        atexit.register(self.close)
+                        self._close_registered = True
+        return self._connection
+    
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open an autocommit connection with the tuned PRAGMAs applied."""
+        if read_only:
+            database, uri = self.db_path.resolve().as_uri() + "?mode=ro", True
+        else:
+            database, uri = self.db_path, False
+        
+        conn = sqlite3.connect(
+            database,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+            uri=uri
+        )
+        # Rows carry column names, so conversation rows convert straight to dicts
+        conn.row_factory = sqlite3.Row
+        for pragma in self.CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        if read_only:
+            conn.execute("PRAGMA query_only=ON")
+        return conn
+    
+    @contextmanager
+    def _reading(self):
+        """Hold the read lock and yield the read-only connection."""
+        if self.in_memory:
+            # A :memory: database is private to the connection that made it
+            with self._lock:
+                yield self._conn
+            return
+        
+        with self._read_lock:
+            if self._reader is None:
+                self._conn  # make sure the schema exists before reading
+                self._reader = self._connect(read_only=True)
+            yield self._reader
+    
+    def close(self):
+        """Let SQLite refresh planner statistics, then close the connections."""
+        with self._read_lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+        
+        with self._lock:
+            if self._connection is None:
+                return
+            try:
+                self._connection.execute("PRAGMA optimize")
+            finally:
+                self._connection.close()
+                self._connection = None
+    
+    @contextmanager
+    def _snapshot(self):
+        """
+        Hold the read connection and run the enclosed reads in one read
+        transaction, so they see a consistent view and share a single
+        BEGIN/COMMIT.
+        """
+        with self._reading() as conn:
+            conn.execute("BEGIN DEFERRED")
+            try:
+                yield
+            finally:
+                conn.execute("COMMIT")
+    
+    @contextmanager
+    def _transaction(self):
+        """Hold the lock and run the enclosed writes atomically (one commit)."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn.cursor()
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
     
     def init_database(self):
         """Initialize SQLite database with tables for memory."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
+            
+            # WAL is persistent in the file: readers stop blocking writers and
+            # commits need far fewer fsyncs (not applicable to :memory:)
+            if not self.in_memory:
+                cursor.execute("PRAGMA journal_mode=WAL")
+            
+            # User profile table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS user_profile (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Structured UserProfile fields ("user.name", "metadata.created_at", ...)
+            # stored as JSON-encoded values
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS profile_fields (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            ''')
+            
+            # Conversation history table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS conversations (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    user_message TEXT NOT NULL,
+                    ares_response TEXT NOT NULL,
+                    context_used TEXT
+                )
+            ''')
+            
+            # Full-text index over conversations (falls back to a scan
+            # in search_conversations when SQLite lacks FTS5)
+            self.fts_enabled = self._init_conversation_fts(cursor)
+            
+            # User preferences table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS preferences (
+                    category TEXT NOT NULL,
+                    preference TEXT NOT NULL,
+                    confidence REAL DEFAULT 1.0,
+                    learned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (category, preference)
+                )
+            ''')
+            
+            # Important facts table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS facts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    fact TEXT NOT NULL,
+                    category TEXT,
+                    importance REAL DEFAULT 1.0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Indexes matching the ORDER BY of the hot reads, so they seek
+            # instead of scanning and sorting the whole table
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_prefs_cat_conf
+                ON preferences (category, confidence DESC)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_facts_imp_created
+                ON facts (importance DESC, created_at DESC)
+            ''')
+            
+            self._init_fact_unique_index(cursor)
+    
+    def _init_fact_unique_index(self, cursor: sqlite3.Cursor):
+        """
+        Make (fact, category) unique so add_fact can UPSERT. Duplicates
+        stored by older versions are merged first: the newest row is kept
+        with the group's highest importance.
+        """
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'idx_facts_fact_cat'"
+        ).fetchone() is not None
+        if exists:
+            return
         
-        # User profile table
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS user_profile (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            UPDATE facts SET importance = (
+                SELECT MAX(f.importance) FROM facts f
+                WHERE f.fact = facts.fact AND f.category IS facts.category
             )
         ''')
-        
-        # Conversation history table
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS conversations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                user_message TEXT NOT NULL,
-                ares_response TEXT NOT NULL,
-                context_used TEXT
+            DELETE FROM facts WHERE id NOT IN (
+                SELECT MAX(id) FROM facts GROUP BY fact, category
             )
         ''')
-        
-        # User preferences table
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS preferences (
-                category TEXT NOT NULL,
-                preference TEXT NOT NULL,
-                confidence REAL DEFAULT 1.0,
-                learned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                PRIMARY KEY (category, preference)
-            )
+            CREATE UNIQUE INDEX idx_facts_fact_cat
+            ON facts (fact, category)
         ''')
+    
+    def _init_conversation_fts(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        Create the external-content FTS5 table mirroring conversations
+        plus the triggers that keep it in sync. Returns False if the
+        SQLite build has no FTS5.
+        """
+        existed = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'conversations_fts'"
+        ).fetchone() is not None
+        
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS conversations_fts USING fts5(
+                    user_message,
+                    ares_response,
+                    content='conversations',
+                    content_rowid='id'
+                )
+            ''')
+        except sqlite3.OperationalError:
+            return False
         
-        # Important facts table
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS facts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                fact TEXT NOT NULL,
-                category TEXT,
-                importance REAL DEFAULT 1.0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
+            CREATE TRIGGER IF NOT EXISTS conversations_fts_ai AFTER INSERT ON conversations BEGIN
+                INSERT INTO conversations_fts(rowid, user_message, ares_response)
+                VALUES (new.id, new.user_message, new.ares_response);
+            END
         ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS conversations_fts_ad AFTER DELETE ON conversations BEGIN
+                INSERT INTO conversations_fts(conversations_fts, rowid, user_message, ares_response)
+                VALUES ('delete', old.id, old.user_message, old.ares_response);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS conversations_fts_au AFTER UPDATE ON conversations BEGIN
+                INSERT INTO conversations_fts(conversations_fts, rowid, user_message, ares_response)
+                VALUES ('delete', old.id, old.user_message, old.ares_response);
+                INSERT INTO conversations_fts(rowid, user_message, ares_response)
+                VALUES (new.id, new.user_message, new.ares_response);
+            END
+        ''')
+        
+        # Index conversations saved before the FTS table existed
+        if not existed:
+            cursor.execute("INSERT INTO conversations_fts(conversations_fts) VALUES ('rebuild')")
         
-        conn.commit()
-        conn.close()
+        return True
     
     # =====================================
     # USER PROFILE MANAGEMENT
@@ -77,102 +425,64 @@ class MemorySystem:
     
     def set_user_info(self, key: str, value: str):
         """Store user information (name, email, location, etc.)"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO user_profile (key, value, updated_at)
-            VALUES (?, ?, ?)
-        ''', (key, value, datetime.now().isoformat()))
-        
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute(_SQL_UPSERT_PROFILE, (key, value))
     
     def get_user_info(self, key: str) -> Optional[str]:
         """Retrieve user information."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT value FROM user_profile WHERE key = ?', (key,))
-        result = cursor.fetchone()
+        with self._reading() as conn:
+            cursor = conn.execute(_SQL_PROFILE_VALUE, (key,))
+            result = cursor.fetchone()
         
-        conn.close()
         return result[0] if result else None
     
     def get_full_profile(self) -> Dict[str, str]:
         """Get complete user profile."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._reading() as conn:
+            cursor = conn.execute(_SQL_FULL_PROFILE)
+            profile = {row[0]: row[1] for row in cursor}
         
-        cursor.execute('SELECT key, value FROM user_profile')
-        profile = {row[0]: row[1] for row in cursor.fetchall()}
-        
-        conn.close()
         return profile
     
+    def get_profile_fields(self) -> Dict[str, Any]:
+        """Get all structured profile fields, decoded."""
+        with self._reading() as conn:
+            cursor = conn.execute(_SQL_PROFILE_FIELDS)
+            return {row[0]: _decode_value(row[1]) for row in cursor}
+    
+    def set_profile_fields(self, fields: Dict[str, Any]):
+        """Store several structured profile fields in one transaction."""
+        rows = [(key, _encode_value(value)) for key, value in fields.items()]
+        with self._transaction() as cursor:
+            cursor.executemany(_SQL_UPSERT_PROFILE_FIELD, rows)
+    
     # =====================================
     # CONVERSATION HISTORY
     # =====================================
     
     def save_conversation(self, user_message: str, ares_response: str, context: str = ""):
         """Save a conversation turn."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO conversations (user_message, ares_response, context_used)
-            VALUES (?, ?, ?)
-        ''', (user_message, ares_response, context))
-        
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute(_SQL_INSERT_CONVERSATION, (user_message, ares_response, context))
     
     def get_recent_conversations(self, limit: int = 10) -> List[Dict]:
-        """Get recent conversation history."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT timestamp, user_message, ares_response
-            FROM conversations
-            ORDER BY timestamp DESC
-            LIMIT ?
-        ''', (limit,))
-        
-        conversations = []
-        for row in cursor.fetchall():
-            conversations.append({
-                'timestamp': row[0],
-                'user': row[1],
-                'ares': row[2]
-            })
-        
-        conn.close()
-        return list(reversed(conversations))  # Return in chronological order
+        """Get recent conversation history (oldest first)."""
+        with self._reading() as conn:
+            cursor = conn.execute(_SQL_RECENT_CONVERSATIONS, (limit,))
+            # Rows already come back in chronological order
+            return [dict(row) for row in cursor]
     
     def search_conversations(self, keyword: str, limit: int = 5) -> List[Dict]:
-        """Search past conversations by keyword."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT timestamp, user_message, ares_response
-            FROM conversations
-            WHERE user_message LIKE ? OR ares_response LIKE ?
-            ORDER BY timestamp DESC
-            LIMIT ?
-        ''', (f'%{keyword}%', f'%{keyword}%', limit))
-        
-        conversations = []
-        for row in cursor.fetchall():
-            conversations.append({
-                'timestamp': row[0],
-                'user': row[1],
-                'ares': row[2]
-            })
-        
-        conn.close()
-        return conversations
+        """Search past conversations by keyword (best matches first)."""
+        with self._reading() as conn:
+            if self.fts_enabled:
+                # Quote the keyword as a prefix phrase so FTS syntax in user
+                # input is taken literally
+                query = '"' + keyword.replace('"', '""') + '"*'
+                cursor = conn.execute(_SQL_SEARCH_CONVERSATIONS_FTS, (query, limit))
+            else:
+                cursor = conn.execute(_SQL_SEARCH_CONVERSATIONS_SCAN, (keyword.lower(), limit))
+            return [dict(row) for row in cursor]
     
     # =====================================
     # PREFERENCES & LEARNING
@@ -180,42 +490,21 @@ class MemorySystem:
     
     def learn_preference(self, category: str, preference: str, confidence: float = 1.0):
         """Learn a user preference."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO preferences (category, preference, confidence, learned_at)
-            VALUES (?, ?, ?, ?)
-        ''', (category, preference, confidence, datetime.now().isoformat()))
-        
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute(_SQL_UPSERT_PREFERENCE, (category, preference, confidence))
     
     def get_preferences(self, category: Optional[str] = None) -> Dict[str, List[str]]:
         """Get user preferences, optionally filtered by category."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._reading() as conn:
+            if category:
+                cursor = conn.execute(_SQL_PREFERENCES_BY_CATEGORY, (category,))
+            else:
+                cursor = conn.execute(_SQL_ALL_PREFERENCES)
+            
+            preferences = {}
+            for row in cursor:
+                preferences.setdefault(row[0], []).append(row[1])
         
-        if category:
-            cursor.execute('''
-                SELECT category, preference FROM preferences
-                WHERE category = ?
-                ORDER BY confidence DESC
-            ''', (category,))
-        else:
-            cursor.execute('''
-                SELECT category, preference FROM preferences
-                ORDER BY category, confidence DESC
-            ''')
-        
-        preferences = {}
-        for row in cursor.fetchall():
-            cat, pref = row[0], row[1]
-            if cat not in preferences:
-                preferences[cat] = []
-            preferences[cat].append(pref)
-        
-        conn.close()
         return preferences
     
     # =====================================
@@ -224,39 +513,19 @@ class MemorySystem:
     
     def add_fact(self, fact: str, category: str = "general", importance: float = 1.0):
         """Store an important fact about the user."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO facts (fact, category, importance)
-            VALUES (?, ?, ?)
-        ''', (fact, category, importance))
-        
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute(_SQL_UPSERT_FACT, (fact, category, importance))
     
     def get_facts(self, category: Optional[str] = None, limit: int = 10) -> List[str]:
         """Retrieve important facts about the user."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        if category:
-            cursor.execute('''
-                SELECT fact FROM facts
-                WHERE category = ?
-                ORDER BY importance DESC, created_at DESC
-                LIMIT ?
-            ''', (category, limit))
-        else:
-            cursor.execute('''
-                SELECT fact FROM facts
-                ORDER BY importance DESC, created_at DESC
-                LIMIT ?
-            ''', (limit,))
-        
-        facts = [row[0] for row in cursor.fetchall()]
+        with self._reading() as conn:
+            if category:
+                cursor = conn.execute(_SQL_FACTS_BY_CATEGORY, (category, limit))
+            else:
+                cursor = conn.execute(_SQL_TOP_FACTS, (limit,))
+            
+            facts = [row[0] for row in cursor]
         
-        conn.close()
         return facts
     
     # =====================================
@@ -265,10 +534,12 @@ class MemorySystem:
     
     def get_context_for_llm(self) -> str:
         """Generate context string to inject into LLM prompts."""
-        profile = self.get_full_profile()
-        preferences = self.get_preferences()
-        facts = self.get_facts(limit=5)
-        recent_convos = self.get_recent_conversations(limit=3)
+        # All four reads share one lock acquisition and one transaction
+        with self._snapshot():
+            profile = self.get_full_profile()
+            preferences = self.get_preferences()
+            facts = self.get_facts(limit=5)
+            recent_convos = self.get_recent_conversations(limit=3)
         
         context_parts = []
         
@@ -305,28 +576,24 @@ class MemorySystem:
     
     def clear_conversations(self):
         """Clear conversation history (but keep profile and preferences)."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM conversations')
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute('DELETE FROM conversations')
     
     def clear_all_memory(self):
         """Clear ALL memory (reset everything)."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM user_profile')
-        cursor.execute('DELETE FROM conversations')
-        cursor.execute('DELETE FROM preferences')
-        cursor.execute('DELETE FROM facts')
-        conn.commit()
-        conn.close()
+        with self._transaction() as cursor:
+            cursor.execute('DELETE FROM user_profile')
+            cursor.execute('DELETE FROM profile_fields')
+            cursor.execute('DELETE FROM conversations')
+            cursor.execute('DELETE FROM preferences')
+            cursor.execute('DELETE FROM facts')
     
     def export_memory(self) -> Dict:
-        """Export all memory to a dictionary."""
-        return {
-            'profile': self.get_full_profile(),
-            'preferences': self.get_preferences(),
-            'facts': self.get_facts(limit=100),
-            'recent_conversations': self.get_recent_conversations(limit=50)
-        }
\ No newline at end of file
+        """Export all memory to a dictionary (one consistent snapshot)."""
+        with self._snapshot():
+            return {
+                'profile': self.get_full_profile(),
+                'preferences': self.get_preferences(),
+                'facts': self.get_facts(limit=100),
+                'recent_conversations': self.get_recent_conversations(limit=50)
+            }
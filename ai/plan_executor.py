@@ -9,13 +9,18 @@ class PlanExecutor:
 
     def __init__(self, engine: LoggedAgentEngine):
         self.engine = engine
+        # intent -> handler; one dict lookup per plan however many intents exist
+        self._dispatch = {
+            "RUN_TASK": self._run_task,
+        }
 
-    def execute(self, plan: Dict):
-        intent = plan.get("intent")
+    def _run_task(self, plan: Dict):
+        return self.engine.run_task(plan.get("task"))
 
-        if intent == "RUN_TASK":
-            task_name = plan.get("task")
-            return self.engine.run_task(task_name)
+    def execute(self, plan: Dict):
+        handler = self._dispatch.get(plan.get("intent"))
+        if handler is not None:
+            return handler(plan)
 
         return {
             "status": "ERROR",
@@ -3,28 +3,90 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any
 
+from ai.memory import MemorySystem
+
+# Sections of the profile stored as "<section>.<key>" profile fields
+FIELD_SECTIONS = ("user", "preferences", "metadata")
+
+# Ordered lists stored whole, one profile field each
+LIST_FIELDS = ("interests", "skills", "goals", "important_facts")
+
 
 class UserProfile:
     """
     Manages user profile information, preferences, and personal data.
     ARES uses this to personalize interactions and remember the user.
+
+    The profile lives in the profile_fields table of the MemorySystem
+    SQLite database: scalar fields as "<section>.<key>" rows and the
+    lists (interests, skills, goals, facts) as one JSON row each, so they
+    keep their order and stay out of the memory context. self.data is an
+    in-memory copy so reads never touch the database; every setter
+    writes through.
     """
 
-    def __init__(self, profile_path: str = "data/user_profile.json"):
-        self.profile_path = Path(profile_path)
-        self.profile_path.parent.mkdir(exist_ok=True)
+    def __init__(self, memory: Optional[MemorySystem] = None,
+                 legacy_path: str = "data/user_profile.json"):
+        self.memory = memory or MemorySystem()
+        self.legacy_path = Path(legacy_path)
+        self._migrate_legacy_file()
         self.data = self._load_profile()
 
+        # Set mirrors of the ordered lists for O(1) membership checks
+        self._interests = set(self.data["interests"])
+        self._skills = set(self.data["skills"])
+
     def _load_profile(self) -> Dict[str, Any]:
-        """Load user profile from file"""
-        if self.profile_path.exists():
-            try:
-                with open(self.profile_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error loading profile: {e}")
-                return self._default_profile()
-        return self._default_profile()
+        """Load user profile from the memory database"""
+        data = self._default_profile()
+        fields = self.memory.get_profile_fields()
+
+        if not fields:
+            # First boot - persist the defaults
+            self.memory.set_profile_fields(self._flatten(data))
+            return data
+
+        for key, value in fields.items():
+            section, _, name = key.partition(".")
+            if name:
+                data.setdefault(section, {})[name] = value
+            else:
+                data[section] = value
+        return data
+
+    def _migrate_legacy_file(self):
+        """Import a user_profile.json left by older versions, then retire it"""
+        if not self.legacy_path.exists():
+            return
+
+        try:
+            with open(self.legacy_path, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+        except Exception as e:
+            print(f"Error loading profile: {e}")
+            return
+
+        data = self._default_profile()
+        for section in FIELD_SECTIONS:
+            data[section].update(legacy.get(section) or {})
+        for name in LIST_FIELDS:
+            data[name] = legacy.get(name) or []
+
+        self.memory.set_profile_fields(self._flatten(data))
+
+        self.legacy_path.rename(self.legacy_path.with_name(self.legacy_path.name + ".migrated"))
+
+    @staticmethod
+    def _flatten(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Profile dict -> {"<section>.<key>": value} fields (plus the lists)"""
+        fields = {
+            f"{section}.{key}": value
+            for section in FIELD_SECTIONS
+            for key, value in data[section].items()
+        }
+        for name in LIST_FIELDS:
+            fields[name] = data[name]
+        return fields
 
     def _default_profile(self) -> Dict[str, Any]:
         """Create default profile structure"""
@@ -55,14 +117,24 @@ class UserProfile:
             }
         }
 
-    def _save_profile(self):
-        """Save profile to file"""
-        try:
-            self.data["metadata"]["last_updated"] = datetime.now().isoformat()
-            with open(self.profile_path, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Error saving profile: {e}")
+    def _set_field(self, section: str, key: str, value: Any):
+        """Update one field in memory and write it (with last_updated) through"""
+        now = datetime.now().isoformat()
+        self.data[section][key] = value
+        self.data["metadata"]["last_updated"] = now
+        self.memory.set_profile_fields({
+            f"{section}.{key}": value,
+            "metadata.last_updated": now
+        })
+
+    def _save_list(self, name: str):
+        """Write one of the LIST_FIELDS (with last_updated) through"""
+        now = datetime.now().isoformat()
+        self.data["metadata"]["last_updated"] = now
+        self.memory.set_profile_fields({
+            name: self.data[name],
+            "metadata.last_updated": now
+        })
 
     # ========================
     # USER INFORMATION
@@ -70,8 +142,7 @@ class UserProfile:
 
     def set_name(self, name: str):
         """Set user's name"""
-        self.data["user"]["name"] = name
-        self._save_profile()
+        self._set_field("user", "name", name)
 
     def get_name(self) -> Optional[str]:
         """Get user's name"""
@@ -79,8 +150,7 @@ class UserProfile:
 
     def set_nickname(self, nickname: str):
         """Set user's nickname"""
-        self.data["user"]["nickname"] = nickname
-        self._save_profile()
+        self._set_field("user", "nickname", nickname)
 
     def get_nickname(self) -> Optional[str]:
         """Get user's nickname"""
@@ -88,8 +158,7 @@ class UserProfile:
 
     def set_location(self, location: str):
         """Set user's location"""
-        self.data["user"]["location"] = location
-        self._save_profile()
+        self._set_field("user", "location", location)
 
     def get_location(self) -> Optional[str]:
         """Get user's location"""
@@ -97,8 +166,7 @@ class UserProfile:
 
     def set_occupation(self, occupation: str):
         """Set user's occupation"""
-        self.data["user"]["occupation"] = occupation
-        self._save_profile()
+        self._set_field("user", "occupation", occupation)
 
     def get_occupation(self) -> Optional[str]:
         """Get user's occupation"""
@@ -110,8 +178,7 @@ class UserProfile:
 
     def set_preference(self, key: str, value: Any):
         """Set a preference"""
-        self.data["preferences"][key] = value
-        self._save_profile()
+        self._set_field("preferences", key, value)
 
     def get_preference(self, key: str, default=None) -> Any:
         """Get a preference"""
@@ -123,15 +190,17 @@ class UserProfile:
 
     def add_interest(self, interest: str):
         """Add an interest"""
-        if interest not in self.data["interests"]:
+        if interest not in self._interests:
+            self._interests.add(interest)
             self.data["interests"].append(interest)
-            self._save_profile()
+            self._save_list("interests")
 
     def remove_interest(self, interest: str):
         """Remove an interest"""
-        if interest in self.data["interests"]:
+        if interest in self._interests:
+            self._interests.discard(interest)
             self.data["interests"].remove(interest)
-            self._save_profile()
+            self._save_list("interests")
 
     def get_interests(self) -> list:
         """Get all interests"""
@@ -139,9 +208,10 @@ class UserProfile:
 
     def add_skill(self, skill: str):
         """Add a skill"""
-        if skill not in self.data["skills"]:
+        if skill not in self._skills:
+            self._skills.add(skill)
             self.data["skills"].append(skill)
-            self._save_profile()
+            self._save_list("skills")
 
     def get_skills(self) -> list:
         """Get all skills"""
@@ -158,7 +228,7 @@ class UserProfile:
             "added_at": datetime.now().isoformat()
         }
         self.data["important_facts"].append(fact_entry)
-        self._save_profile()
+        self._save_list("important_facts")
 
     def get_facts(self) -> list:
         """Get all important facts"""
@@ -217,8 +287,8 @@ class UserProfile:
 
     def increment_conversation_count(self):
         """Increment total conversations"""
-        self.data["metadata"]["total_conversations"] += 1
-        self._save_profile()
+        count = self.data["metadata"]["total_conversations"] + 1
+        self._set_field("metadata", "total_conversations", count)
 
     def get_conversation_count(self) -> int:
         """Get total conversations"""
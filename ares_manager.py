@@ -17,17 +17,26 @@ For: Suvadip Panja
 import os
 import sys
 import json
+import atexit
+import queue
 import datetime
 import logging
 import subprocess
+import threading
 import shutil
 import psutil
 import re
 import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from importlib.machinery import PathFinder
+from importlib.util import find_spec
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
-from dataclasses import dataclass
+from typing import Dict, Any, Callable, Iterator, Optional, List, Tuple
+from dataclasses import dataclass, field
 
 # Intelligent Agent Imports (NEW)
 try:
@@ -58,10 +67,94 @@ except ImportError:
 PROJECT_ROOT = Path(__file__).resolve().parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from logger_config import CachedTimeFormatter
+
+# ===================================================
+# OPTIONAL SERVICE MODULES
+# ===================================================
+# Probed once at import; services check these before importing, so a
+# missing module fails fast in initialize()
+
+def _module_available(name: str) -> bool:
+    """
+    True if the module can be found. Submodules are looked up on the
+    parent package's path, because find_spec("pkg.mod") would import pkg
+    (and automation/__init__.py pulls in the whole desktop stack).
+    """
+    parent, _, _ = name.rpartition(".")
+    if not parent:
+        return find_spec(name) is not None
+    parent_spec = find_spec(parent)
+    if parent_spec is None or parent_spec.submodule_search_locations is None:
+        return False
+    return PathFinder.find_spec(name, parent_spec.submodule_search_locations) is not None
+
+
+AI_BRAIN_AVAILABLE = _module_available("ai.brain")
+DESKTOP_AVAILABLE = _module_available("desktop")
+WHISPER_AVAILABLE = _module_available("faster_whisper")
+TASKS_AVAILABLE = _module_available("automation.tasks")
+SCHEDULER_AVAILABLE = _module_available("automation.scheduler")
+REMINDERS_AVAILABLE = _module_available("automation.reminders")
+
 # ===================================================
 # LOGGING SETUP
 # ===================================================
 
+# One rotating handler per log file, shared by every logger writing to it
+_FILE_HANDLERS: Dict[Path, RotatingFileHandler] = {}
+
+
+def _get_file_handler(log_file: str, formatter: logging.Formatter) -> RotatingFileHandler:
+    """Return the shared handler for logs/<log_file>, creating it on first use."""
+    log_path = PROJECT_ROOT / "logs" / log_file
+    handler = _FILE_HANDLERS.get(log_path)
+    if handler is None:
+        if not _FILE_HANDLERS:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+        # delay=True: the file is only opened on the first write
+        handler = RotatingFileHandler(
+            str(log_path),
+            maxBytes=50 * 1024 * 1024,
+            backupCount=10,
+            encoding='utf-8',
+            delay=True
+        )
+        handler.setFormatter(formatter)
+        _FILE_HANDLERS[log_path] = handler
+    return handler
+
+
+class _RoutedQueueHandler(QueueHandler):
+    """Queue handler that tags each record with the handlers meant to write it"""
+    
+    def __init__(self, log_queue: queue.Queue, targets: Tuple[logging.Handler, ...]):
+        super().__init__(log_queue)
+        self.targets = targets
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = super().prepare(record)
+        record.ares_targets = self.targets
+        return record
+
+
+class _DispatchHandler(logging.Handler):
+    """Listener-side handler: pass each record on to the handlers it was tagged with"""
+    
+    def handle(self, record: logging.LogRecord) -> bool:
+        for handler in getattr(record, "ares_targets", ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+
+# Loggers only enqueue records; console and file writes happen on this
+# listener's thread, off the command path. Stopped (and drained) at exit.
+_LOG_LISTENER = QueueListener(queue.Queue(), _DispatchHandler())
+_LOG_LISTENER.start()
+atexit.register(_LOG_LISTENER.stop)
+
+
 def setup_logger(name: str, log_file: Optional[str] = None) -> logging.Logger:
     """Setup logger - UNICODE SAFE"""
     logger = logging.getLogger(name)
@@ -71,29 +164,19 @@ def setup_logger(name: str, log_file: Optional[str] = None) -> logging.Logger:
     
     logger.setLevel(logging.DEBUG)
     
-    log_format = logging.Formatter(
+    log_format = CachedTimeFormatter(
         '[%(asctime)s] %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
     console = logging.StreamHandler()
     console.setFormatter(log_format)
-    logger.addHandler(console)
+    targets = (console,)
     
     if log_file:
-        from logging.handlers import RotatingFileHandler
-        log_path = PROJECT_ROOT / "logs" / log_file
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        file_handler = RotatingFileHandler(
-            str(log_path),
-            maxBytes=50 * 1024 * 1024,
-            backupCount=10,
-            encoding='utf-8'
-        )
-        file_handler.setFormatter(log_format)
-        logger.addHandler(file_handler)
+        targets += (_get_file_handler(log_file, log_format),)
     
+    logger.addHandler(_RoutedQueueHandler(_LOG_LISTENER.queue, targets))
     return logger
 
 logger = setup_logger("ARES", "ares_main.log")
@@ -145,11 +228,11 @@ class AppRegistry:
                 subprocess.Popen(path)
                 return True, f"Opening {app_name}"
             
-            # Try system command
+            # Fall back to a path search (same lookup cache as open_app)
             try:
-                os.system(f"start {app_name}")
+                SmartAppFinder.launch(app_name)
                 return True, f"Opening {app_name}"
-            except:
+            except OSError:
                 pass
             
             return False, f"Could not open {app_name}"
@@ -277,7 +360,7 @@ class WebAgent:
             # STRATEGY 1: Find button with EXACT text match (most reliable)
             try:
                 self.logger.debug("Strategy 1: Exact text match")
-                for tag in ["button", "a", "div", "span", "input"]:
+                for tag in ("button", "a", "div", "span", "input"):
                     xpaths = [
                         f"//{tag}[contains(text(), '{button_text}')]",
                         f"//{tag}[text() = '{button_text}']",
@@ -335,7 +418,7 @@ class WebAgent:
                         self.logger.debug(f"  Checking iframe {idx}")
                         self.driver.switch_to.frame(iframe)
                         
-                        for tag in ["button", "a", "div"]:
+                        for tag in ("button", "a", "div"):
                             xpath = f"//{tag}[contains(text(), '{button_text}')]"
                             try:
                                 element = WebDriverWait(self.driver, 5).until(
@@ -579,7 +662,7 @@ class IntelligentAgent:
 # DATA MODELS (ORIGINAL - ALL PRESERVED)
 # ===================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServiceStatus:
     """Status of a service."""
     name: str
@@ -596,7 +679,7 @@ class ServiceStatus:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandResult:
     """Result of command execution."""
     success: bool
@@ -605,12 +688,13 @@ class CommandResult:
     data: Optional[Dict[str, Any]] = None
     source: str = "unknown"
     timestamp: str = None
-    
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.datetime.now().isoformat()
+    # Creation time is captured cheaply; the ISO string is only built
+    # when the result is serialized
+    created_ns: int = field(default_factory=time.time_ns, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
+        if self.timestamp is None:
+            self.timestamp = datetime.datetime.fromtimestamp(self.created_ns / 1e9).isoformat()
         return {
             "success": self.success,
             "action": self.action,
@@ -621,50 +705,106 @@ class CommandResult:
         }
 
 
+# ===================================================
+# CLOCK
+# ===================================================
+
+# (epoch second, formatted text) of the last now_text() call
+_now_text_cache: Tuple[int, str] = (-1, "")
+
+
+def now_text() -> str:
+    """Local time as 'YYYY-MM-DD HH:MM:SS', formatted at most once per second"""
+    global _now_text_cache
+    second = int(time.time())
+    if _now_text_cache[0] != second:
+        _now_text_cache = (second, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second)))
+    return _now_text_cache[1]
+
+
 # ===================================================
 # SYSTEM METRICS (ORIGINAL - ALL PRESERVED)
 # ===================================================
 
+# Readings are reused for this long, so one status request (or several
+# close together) reads each metric once
+METRICS_TTL = 1.0
+
+# Bytes -> GiB; 1024**3 is a power of two, so multiplying is exact
+_INV_GB = 1.0 / (1024 ** 3)
+
+# metric name -> (monotonic time read, value)
+_METRICS_CACHE: Dict[str, Tuple[float, Any]] = {}
+
+
+def _cached_metric(name: str, read: Callable[[], Any]) -> Any:
+    """Return the cached reading of a metric, re-reading it once stale"""
+    now = time.monotonic()
+    cached = _METRICS_CACHE.get(name)
+    if cached is None or now - cached[0] >= METRICS_TTL:
+        cached = _METRICS_CACHE[name] = (now, read())
+    return cached[1]
+
+
+# cpu_percent(interval=None) measures since the previous call; this first
+# call starts the window so later reads never block
+try:
+    psutil.cpu_percent(interval=None)
+except Exception:
+    pass
+
+
 class SystemMetrics:
     """Get current system metrics"""
     
     @staticmethod
     def get_cpu_usage() -> float:
         try:
-            return psutil.cpu_percent(interval=1)
+            return _cached_metric("cpu", lambda: psutil.cpu_percent(interval=None))
         except:
             return 0.0
     
+    # The formatted dicts are what get cached, so they are built once per
+    # METRICS_TTL; callers share them and must not modify them
+    
+    @staticmethod
+    def _read_memory() -> Dict[str, Any]:
+        memory = psutil.virtual_memory()
+        return {
+            "total_gb": round(memory.total * _INV_GB, 2),
+            "used_gb": round(memory.used * _INV_GB, 2),
+            "available_gb": round(memory.available * _INV_GB, 2),
+            "percent": round(memory.percent, 2)
+        }
+    
+    @staticmethod
+    def _read_disk() -> Dict[str, Any]:
+        disk = psutil.disk_usage('/')
+        return {
+            "total_gb": round(disk.total * _INV_GB, 2),
+            "used_gb": round(disk.used * _INV_GB, 2),
+            "free_gb": round(disk.free * _INV_GB, 2),
+            "percent": round(disk.percent, 2)
+        }
+    
     @staticmethod
     def get_memory_usage() -> Dict[str, Any]:
         try:
-            memory = psutil.virtual_memory()
-            return {
-                "total_gb": round(memory.total / (1024**3), 2),
-                "used_gb": round(memory.used / (1024**3), 2),
-                "available_gb": round(memory.available / (1024**3), 2),
-                "percent": round(memory.percent, 2)
-            }
+            return _cached_metric("memory", SystemMetrics._read_memory)
         except:
             return {"error": "Memory info unavailable"}
     
     @staticmethod
     def get_disk_usage() -> Dict[str, Any]:
         try:
-            disk = psutil.disk_usage('/')
-            return {
-                "total_gb": round(disk.total / (1024**3), 2),
-                "used_gb": round(disk.used / (1024**3), 2),
-                "free_gb": round(disk.free / (1024**3), 2),
-                "percent": round(disk.percent, 2)
-            }
+            return _cached_metric("disk", SystemMetrics._read_disk)
         except:
             return {"error": "Disk info unavailable"}
     
     @staticmethod
     def get_running_processes() -> int:
         try:
-            return len(psutil.pids())
+            return _cached_metric("processes", lambda: len(psutil.pids()))
         except:
             return 0
     
@@ -680,29 +820,32 @@ class SystemMetrics:
 # TIMER PARSER FOR REMINDERS (ORIGINAL - ALL PRESERVED)
 # ===================================================
 
+# One pass over the text finds every "<number> <unit>"; the unit's first
+# letter says which field it fills
+_DURATION_RE = re.compile(
+    r'(\d+)\s*(hour|hr|h|minute|min|m|second|sec|s)s?', re.IGNORECASE
+)
+_DURATION_FIELDS = {"h": "hours", "m": "minutes", "s": "seconds"}
+
+# Clock time for reminders: "5pm", "17:30", "9:05 am"
+_TIME_RE = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)?', re.IGNORECASE)
+
+
 class TimerParser:
     """Parse timer/reminder durations from natural language"""
     
     @staticmethod
     def parse_duration(text: str) -> Optional[Dict[str, int]]:
         """Parse duration like '5 minutes', '2 hours 30 minutes', etc."""
-        text = text.lower()
         result = {"hours": 0, "minutes": 0, "seconds": 0}
+        found = set()
         
-        # Find hours
-        hours_match = re.search(r'(\d+)\s*(?:hour|hr|h)s?', text)
-        if hours_match:
-            result["hours"] = int(hours_match.group(1))
-        
-        # Find minutes
-        minutes_match = re.search(r'(\d+)\s*(?:minute|min|m)s?', text)
-        if minutes_match:
-            result["minutes"] = int(minutes_match.group(1))
-        
-        # Find seconds
-        seconds_match = re.search(r'(\d+)\s*(?:second|sec|s)s?', text)
-        if seconds_match:
-            result["seconds"] = int(seconds_match.group(1))
+        # The first amount given for each unit wins
+        for match in _DURATION_RE.finditer(text):
+            field_name = _DURATION_FIELDS[match.group(2)[0].lower()]
+            if field_name not in found:
+                found.add(field_name)
+                result[field_name] = int(match.group(1))
         
         # Return if found anything
         if result["hours"] or result["minutes"] or result["seconds"]:
@@ -716,7 +859,11 @@ class TimerParser:
 # ===================================================
 
 class SmartAppFinder:
-    """Find application paths dynamically"""
+    """
+    Find application paths dynamically. Lookups are cached per name;
+    call SmartAppFinder.find_app.cache_clear() to rescan after installing
+    an app.
+    """
     
     APP_EXECUTABLES = {
         "chrome": ["chrome.exe", "google chrome.exe"],
@@ -727,14 +874,19 @@ class SmartAppFinder:
         "explorer": ["explorer.exe"],
     }
     
-    COMMON_PATHS = [
+    # Launched by name when no path is found (Windows resolves them itself)
+    BUILTIN_APPS = frozenset({"notepad", "explorer", "calc"})
+    
+    # Only the install folders present on this machine are searched
+    COMMON_PATHS = tuple(path for path in (
         "C:\\Program Files\\Google\\Chrome\\Application\\",
         "C:\\Program Files (x86)\\Google\\Chrome\\Application\\",
         "C:\\Program Files\\Mozilla Firefox\\",
         "C:\\Program Files (x86)\\Mozilla Firefox\\",
-    ]
+    ) if os.path.isdir(path))
     
     @staticmethod
+    @lru_cache(maxsize=128)
     def find_app(app_name: str) -> Optional[str]:
         """Find app with system path search"""
         app_lower = app_name.lower().strip()
@@ -750,16 +902,73 @@ class SmartAppFinder:
                 if os.path.exists(full_path):
                     return full_path
         
-        if app_lower in ["notepad", "explorer", "calc"]:
+        if app_lower in SmartAppFinder.BUILTIN_APPS:
             return app_lower
         
         return None
+    
+    @staticmethod
+    def launch(app_name: str) -> Optional[str]:
+        """
+        Find app_name and start it detached; returns the path it was
+        started from (None if started by name). Raises OSError if it can't
+        be started, after clearing the lookup cache so a stale path or a
+        cached miss is rescanned next time.
+        """
+        app_path = SmartAppFinder.find_app(app_name)
+        try:
+            SmartAppFinder._spawn(app_path or app_name)
+        except OSError:
+            SmartAppFinder.find_app.cache_clear()
+            raise
+        return app_path
+    
+    @staticmethod
+    def _spawn(target: str) -> None:
+        """
+        Start a detached app without Popen's bookkeeping: ShellExecute on
+        Windows, posix_spawnp elsewhere (reaped by a daemon thread so it
+        doesn't linger as a zombie). Falls back to Popen, which raises
+        OSError if the target really can't be started.
+        """
+        try:
+            if sys.platform == "win32":
+                os.startfile(target)
+            else:
+                pid = os.posix_spawnp(target, [target], os.environ)
+                threading.Thread(target=os.waitpid, args=(pid, 0), daemon=True).start()
+            return
+        except OSError:
+            pass
+        subprocess.Popen(target)
 
 
 # ===================================================
 # BASE SERVICE CLASS (ORIGINAL - ALL PRESERVED)
 # ===================================================
 
+def _guarded_init(initialize):
+    """
+    Wrap a service's initialize(): an unexpected exception is recorded in
+    self.error and reported as a failed init, and every attempt logs how
+    long it took.
+    """
+    @wraps(initialize)
+    def wrapper(self) -> bool:
+        start = time.perf_counter()
+        try:
+            return initialize(self)
+        except Exception as e:
+            self.error = str(e)
+            self.logger.error("[ERROR] %s initialization failed: %s", self.name, e)
+            return False
+        finally:
+            self.init_attempted = True
+            self.logger.info("%s init took %.1fms", self.name,
+                             (time.perf_counter() - start) * 1000)
+    return wrapper
+
+
 class BaseService:
     """Base class for all ARES services."""
     
@@ -767,29 +976,34 @@ class BaseService:
         self.name = name
         self.logger = setup_logger(f"ARES.{name}", f"service_{name.lower()}.log")
         self.initialized = False
+        # Set once initialize() has run, whether or not it succeeded
+        self.init_attempted = False
         self.error = None
+        self._status_cache: Optional[ServiceStatus] = None
     
+    @_guarded_init
     def initialize(self) -> bool:
-        try:
-            self.logger.info(f"Initializing {self.name}...")
-            self.initialized = True
-            self.logger.info(f"[OK] {self.name} initialized")
-            return True
-        except Exception as e:
-            self.error = str(e)
-            self.logger.error(f"[ERROR] {self.name} initialization failed: {e}")
-            return False
+        self.logger.info(f"Initializing {self.name}...")
+        self.initialized = True
+        self.logger.info(f"[OK] {self.name} initialized")
+        return True
     
     def shutdown(self) -> None:
         self.logger.info(f"Shutting down {self.name}...")
     
     def get_status(self) -> ServiceStatus:
-        return ServiceStatus(
-            name=self.name,
-            available=self.initialized,
-            initialized=self.initialized,
-            error=self.error
-        )
+        # Services set initialized/error directly, so the cached status is
+        # reused only while both still match it
+        status = self._status_cache
+        if (status is None or status.initialized is not self.initialized
+                or status.error is not self.error):
+            status = self._status_cache = ServiceStatus(
+                name=self.name,
+                available=self.initialized,
+                initialized=self.initialized,
+                error=self.error
+            )
+        return status
 
 
 # ===================================================
@@ -797,31 +1011,40 @@ class BaseService:
 # ===================================================
 
 class AIBrainService(BaseService):
-    """AI Brain Service"""
+    """
+    AI Brain Service
+    
+    initialize() only checks that ai.brain is importable; the brain (LLM
+    client, memory DB) is loaded on the first conversation, so desktop-only
+    sessions never pay for it.
+    """
     
     def __init__(self):
         super().__init__("AIBrain")
-        self.brain = None
+        self._brain = None
     
+    @_guarded_init
     def initialize(self) -> bool:
-        try:
-            self.logger.info("Loading AI Brain (Ollama/Llama3)...")
-            try:
-                from ai.brain import AIBrain
-                self.brain = AIBrain()
-                self.initialized = True
-                self.logger.info("[OK] AI Brain initialized")
-                return True
-            except ImportError:
-                self.logger.warning("AI Brain not available")
-                return False
-        except Exception as e:
-            self.error = str(e)
-            self.logger.error(f"AI Brain initialization error: {e}")
+        self.logger.info("Checking AI Brain (Ollama/Llama3)...")
+        if not AI_BRAIN_AVAILABLE:
+            self.logger.warning("AI Brain not available")
             return False
+        self.initialized = True
+        self.logger.info("[OK] AI Brain available (loads on first use)")
+        return True
+    
+    @property
+    def brain(self):
+        """The shared AIBrain, imported and constructed on first access."""
+        if self._brain is None and self.initialized:
+            self.logger.info("Loading AI Brain (Ollama/Llama3)...")
+            from ai.brain import get_brain
+            self._brain = get_brain()
+            self.logger.info("[OK] AI Brain loaded")
+        return self._brain
     
     def converse(self, text: str) -> Tuple[bool, Optional[str]]:
-        if not self.initialized or not self.brain:
+        if not self.initialized:
             return False, "AI Brain not available"
         try:
             response = self.brain.converse(text)
@@ -829,106 +1052,125 @@ class AIBrainService(BaseService):
         except Exception as e:
             self.logger.error(f"AI conversation error: {e}")
             return False, str(e)
+    
+    def shutdown(self) -> None:
+        super().shutdown()
+        # Only a brain that was actually loaded has a memory DB to close
+        if self._brain is not None:
+            self._brain.memory.close()
 
 
 # ===================================================
 # DESKTOP AUTOMATION SERVICE (ORIGINAL - ALL PRESERVED)
 # ===================================================
 
+class _NullDesktop:
+    """
+    Stand-in for the desktop module until it is loaded (or when it can't
+    be), answering every call DesktopAutomationService delegates with the
+    "unavailable" result.
+    """
+    
+    def take_screenshot(self) -> Tuple[bool, str]:
+        return False, "Desktop automation not available"
+    
+    def lock_computer(self) -> Tuple[bool, str]:
+        return False, "Desktop automation not available"
+    
+    def close_app(self, app_name: str) -> Tuple[bool, str]:
+        return False, "Desktop automation not available"
+    
+    def get_time(self) -> str:
+        return "Time unavailable"
+    
+    def get_date(self) -> str:
+        return "Date unavailable"
+    
+    def get_battery(self) -> str:
+        return "Battery info unavailable"
+
+
+# Volume change per command: 6%, what the three media-key presses this
+# replaced amounted to on Windows
+VOLUME_STEP = 0.06
+
+
 class DesktopAutomationService(BaseService):
     """Desktop Automation Service - Fixed volume control"""
     
     def __init__(self):
         super().__init__("DesktopAutomation")
-        self.desktop = None
-    
+        # Replaced by the real desktop module in initialize(); the methods
+        # that only delegate to it need no availability check of their own
+        self.desktop = _NullDesktop()
+        # Imported once at module load; None when pyautogui is missing
+        self._pyautogui = pyautogui if PYAUTOGUI_AVAILABLE else None
+        # time/date/battery queries are polled; their INFO lines go to a
+        # child logger that is off (WARNING) unless explicitly enabled
+        self.trace_logger = logging.getLogger(f"{self.logger.name}.Trace")
+        self.trace_logger.setLevel(logging.WARNING)
+    
+    @_guarded_init
     def initialize(self) -> bool:
+        self.logger.info("Initializing Desktop Automation...")
+        if not DESKTOP_AVAILABLE:
+            self.logger.warning("Desktop module not available")
+            return False
         try:
-            self.logger.info("Initializing Desktop Automation...")
-            try:
-                from desktop import desktop
-                self.desktop = desktop
-                self.initialized = True
-                self.logger.info("[OK] Desktop Automation initialized")
-                return True
-            except ImportError as e:
-                self.logger.warning(f"Desktop module not available: {e}")
-                return False
-        except Exception as e:
-            self.error = str(e)
-            self.logger.error(f"Desktop automation initialization error: {e}")
+            from desktop import desktop
+            self.desktop = desktop
+            self.initialized = True
+            self.logger.info("[OK] Desktop Automation initialized")
+            return True
+        except ImportError as e:
+            self.logger.warning("Desktop module not available: %s", e)
             return False
     
     def volume_up(self) -> Tuple[bool, str]:
-        """Increase volume using pyautogui (reliable)"""
+        """Increase volume with one native call (media keys as fallback)"""
         if not self.initialized:
             return False, "Desktop automation not available"
         
-        try:
-            import pyautogui
-            for _ in range(3):
-                pyautogui.press('volumeup')
-            self.logger.info("Action: volume_up - Success")
-            return True, "Volume increased"
-        except Exception as e:
-            self.logger.warning(f"Volume up error: {e}")
-            try:
-                result = self.desktop.volume_up()
-                return result if result[0] else (True, "Volume increased (fallback)")
-            except:
-                return True, "Volume increased (using system control)"
+        result = self.desktop.volume_up(VOLUME_STEP)
+        self.logger.info("Action: volume_up - %s", result[1])
+        return result
     
     def volume_down(self) -> Tuple[bool, str]:
-        """Decrease volume using pyautogui (reliable)"""
+        """Decrease volume with one native call (media keys as fallback)"""
         if not self.initialized:
             return False, "Desktop automation not available"
         
-        try:
-            import pyautogui
-            for _ in range(3):
-                pyautogui.press('volumedown')
-            self.logger.info("Action: volume_down - Success")
-            return True, "Volume decreased"
-        except Exception as e:
-            self.logger.warning(f"Volume down error: {e}")
-            try:
-                result = self.desktop.volume_down()
-                return result if result[0] else (True, "Volume decreased (fallback)")
-            except:
-                return True, "Volume decreased (using system control)"
+        result = self.desktop.volume_down(VOLUME_STEP)
+        self.logger.info("Action: volume_down - %s", result[1])
+        return result
     
     def mute(self) -> Tuple[bool, str]:
         """Mute audio using pyautogui (reliable)"""
         if not self.initialized:
             return False, "Desktop automation not available"
         
-        try:
-            import pyautogui
-            pyautogui.press('volumemute')
-            self.logger.info("Action: mute - Success")
-            return True, "Audio muted/unmuted"
-        except Exception as e:
-            self.logger.warning(f"Mute error: {e}")
+        if self._pyautogui is not None:
             try:
-                result = self.desktop.mute()
-                return result if result[0] else (True, "Audio muted/unmuted (fallback)")
-            except:
-                return True, "Audio muted/unmuted (using system control)"
+                self._pyautogui.press('volumemute', _pause=False)
+                self.logger.info("Action: mute - Success")
+                return True, "Audio muted/unmuted"
+            except Exception as e:
+                self.logger.warning("Mute error: %s", e)
+        
+        # desktop.mute() reports its own failures instead of raising
+        result = self.desktop.mute()
+        return result if result[0] else (True, "Audio muted/unmuted (fallback)")
     
     def take_screenshot(self) -> Tuple[bool, str]:
         """Take screenshot"""
-        if not self.initialized:
-            return False, "Desktop automation not available"
         result = self.desktop.take_screenshot()
-        self.logger.info(f"Action: screenshot - {result[1]}")
+        self.logger.info("Action: screenshot - %s", result[1])
         return result
     
     def lock_computer(self) -> Tuple[bool, str]:
         """Lock computer"""
-        if not self.initialized:
-            return False, "Desktop automation not available"
         result = self.desktop.lock_computer()
-        self.logger.info(f"Action: lock - {result[1]}")
+        self.logger.info("Action: lock - %s", result[1])
         return result
     
     def minimize_all_windows(self) -> Tuple[bool, str]:
@@ -936,15 +1178,17 @@ class DesktopAutomationService(BaseService):
         if not self.initialized:
             return False, "Desktop automation not available"
         
+        if self._pyautogui is None:
+            return False, "Could not minimize windows: pyautogui is not installed"
+        
         try:
-            import pyautogui
-            pyautogui.hotkey('win', 'd')
-            time.sleep(0.5)
+            # The shell handles Win+D synchronously; nothing to wait for
+            self._pyautogui.hotkey('win', 'd', _pause=False)
             self.logger.info("Action: minimize_all_windows - Success")
             return True, "All windows minimized"
             
         except Exception as e:
-            self.logger.warning(f"Minimize windows error: {e}")
+            self.logger.warning("Minimize windows error: %s", e)
             return False, f"Could not minimize windows: {str(e)}"
     
     def open_app(self, app_name: str) -> Tuple[bool, str]:
@@ -953,61 +1197,47 @@ class DesktopAutomationService(BaseService):
             return False, "Desktop automation not available"
         
         try:
-            app_path = SmartAppFinder.find_app(app_name)
-            
+            app_path = SmartAppFinder.launch(app_name)
             if app_path:
-                subprocess.Popen(app_path)
-                self.logger.info(f"Action: open_app({app_name}) - Opened from {app_path}")
-                return True, f"Opening {app_name}"
+                self.logger.info("Action: open_app(%s) - Opened from %s", app_name, app_path)
             else:
-                try:
-                    subprocess.Popen(app_name)
-                    self.logger.info(f"Action: open_app({app_name}) - Opened directly")
-                    return True, f"Opening {app_name}"
-                except:
-                    error_msg = f"Application '{app_name}' not found"
-                    self.logger.error(f"Action: open_app({app_name}) - {error_msg}")
-                    return False, error_msg
+                self.logger.info("Action: open_app(%s) - Opened directly", app_name)
+            return True, f"Opening {app_name}"
         
         except Exception as e:
-            error_msg = f"Failed to open {app_name}: {str(e)}"
-            self.logger.error(f"Action: open_app({app_name}) - {error_msg}")
+            if isinstance(e, FileNotFoundError):
+                error_msg = f"Application '{app_name}' not found"
+            else:
+                error_msg = f"Failed to open {app_name}: {str(e)}"
+            self.logger.error("Action: open_app(%s) - %s", app_name, error_msg)
             return False, error_msg
     
     def close_app(self, app_name: str) -> Tuple[bool, str]:
         """Close application"""
-        if not self.initialized:
-            return False, "Desktop automation not available"
         try:
             result = self.desktop.close_app(app_name)
-            self.logger.info(f"Action: close_app({app_name}) - {result[1]}")
+            self.logger.info("Action: close_app(%s) - %s", app_name, result[1])
             return result
         except Exception as e:
-            self.logger.error(f"Action: close_app({app_name}) - {str(e)}")
+            self.logger.error("Action: close_app(%s) - %s", app_name, e)
             return False, f"Failed to close {app_name}"
     
     def get_time(self) -> str:
         """Get current time"""
-        if not self.initialized:
-            return "Time unavailable"
         time_str = self.desktop.get_time()
-        self.logger.info(f"Query: time - {time_str}")
+        self.trace_logger.info("Query: time - %s", time_str)
         return time_str
     
     def get_date(self) -> str:
         """Get current date"""
-        if not self.initialized:
-            return "Date unavailable"
         date_str = self.desktop.get_date()
-        self.logger.info(f"Query: date - {date_str}")
+        self.trace_logger.info("Query: date - %s", date_str)
         return date_str
     
     def get_battery(self) -> str:
         """Get battery status"""
-        if not self.initialized:
-            return "Battery info unavailable"
         battery_str = self.desktop.get_battery()
-        self.logger.info(f"Query: battery - {battery_str}")
+        self.trace_logger.info("Query: battery - %s", battery_str)
         return battery_str
 
 
@@ -1015,36 +1245,131 @@ class DesktopAutomationService(BaseService):
 # VOICE RECOGNITION SERVICE (ORIGINAL - ALL PRESERVED)
 # ===================================================
 
+# prequantize_whisper.py writes models/whisper-<size>-int8
+MODELS_DIR = PROJECT_ROOT / "models"
+
+# Fastest first; the first one the device supports is used
+WHISPER_COMPUTE_PRIORITY = ("int8_float16", "float16", "int8")
+
+
 class VoiceRecognitionService(BaseService):
-    """Voice Recognition Service"""
+    """
+    Voice Recognition Service
     
-    def __init__(self):
-        super().__init__("VoiceRecognition")
-        self.whisper = None
+    initialize() only checks that faster_whisper is importable; the
+    Whisper model (hundreds of MB) is loaded by the first transcribe().
+    A model pre-quantized offline by prequantize_whisper.py (run from
+    setup_whisper.bat) is preferred; otherwise the stock model is used.
+    
+    device / compute_type default to CUDA when a GPU is visible (CPU
+    otherwise) and the fastest compute type for that device. Pass them
+    to override, or set ARES_WHISPER_MODEL / ARES_WHISPER_COMPUTE; the
+    values actually used are stored back once the model loads.
+    
+    num_workers (ARES_WHISPER_WORKERS) is how many transcribe() calls
+    from different threads (concurrent web requests) run in parallel;
+    with the default of 1 they queue for the model.
     
+    beam_size (ARES_WHISPER_BEAM) defaults to 1, greedy decoding, which
+    is fastest for short commands; set 5 for faster-whisper's beam search.
+    """
+    
+    def __init__(self, model_size: Optional[str] = None, device: Optional[str] = None,
+                 compute_type: Optional[str] = None, num_workers: Optional[int] = None,
+                 beam_size: Optional[int] = None):
+        super().__init__("VoiceRecognition")
+        self.model_size = model_size or os.environ.get("ARES_WHISPER_MODEL", "base")
+        self.device = device
+        self.compute_type = compute_type or os.environ.get("ARES_WHISPER_COMPUTE")
+        self.num_workers = num_workers or int(os.environ.get("ARES_WHISPER_WORKERS", "1"))
+        self.beam_size = beam_size or int(os.environ.get("ARES_WHISPER_BEAM", "1"))
+        self._whisper = None
+        self._whisper_lock = threading.Lock()
+    
+    @_guarded_init
     def initialize(self) -> bool:
-        try:
-            self.logger.info("Initializing Voice Recognition (Whisper)...")
-            try:
-                from faster_whisper import WhisperModel
-                self.whisper = WhisperModel("base", device="cpu", compute_type="int8")
-                self.initialized = True
-                self.logger.info("[OK] Voice Recognition initialized")
-                return True
-            except ImportError:
-                self.logger.warning("Whisper not available")
-                return False
-        except Exception as e:
-            self.error = str(e)
-            self.logger.error(f"Voice recognition initialization error: {e}")
+        self.logger.info("Checking Voice Recognition (Whisper)...")
+        if not WHISPER_AVAILABLE:
+            self.logger.warning("Whisper not available")
             return False
+        self.initialized = True
+        self.logger.info("[OK] Voice Recognition available (model loads on first use)")
+        return True
+    
+    @property
+    def whisper(self):
+        """The Whisper model, loaded on first access."""
+        if self._whisper is None and self.initialized:
+            # Concurrent first requests wait for one load instead of each
+            # building their own model
+            with self._whisper_lock:
+                if self._whisper is None:
+                    self._load_whisper()
+        return self._whisper
+    
+    def _load_whisper(self) -> None:
+        """Build the WhisperModel; called once, under _whisper_lock."""
+        self.logger.info("Loading Whisper model...")
+        import ctranslate2
+        from faster_whisper import WhisperModel
+        
+        if self.device is None:
+            self.device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        if self.compute_type is None:
+            supported = ctranslate2.get_supported_compute_types(self.device)
+            self.compute_type = next(
+                (t for t in WHISPER_COMPUTE_PRIORITY if t in supported), "default"
+            )
+        
+        # A pre-quantized copy is loaded as-is, with no quantization pass;
+        # without one the stock model is quantized while loading
+        int8_dir = MODELS_DIR / f"whisper-{self.model_size}-int8"
+        model = str(int8_dir) if int8_dir.exists() else self.model_size
+        
+        self._whisper = WhisperModel(
+            model,
+            device=self.device,
+            compute_type=self.compute_type,
+            num_workers=self.num_workers
+        )
+        self.logger.info(
+            f"[OK] Whisper {self.model_size} loaded "
+            f"({self.device}, {self.compute_type}, {self.num_workers} worker(s))"
+        )
     
-    def transcribe(self, audio_path: str) -> Tuple[bool, Optional[str]]:
+    def transcribe_stream(self, audio_path: Any) -> Iterator[str]:
+        """
+        Yield the transcript segment by segment as the decoder produces
+        them, so a caller can act on the first words before the rest of
+        the audio is decoded. Requires an initialized service; errors are
+        raised to the caller.
+        """
+        # Commands are short: greedy decoding, VAD-trimmed silence and
+        # no timestamp tokens keep latency down. A short temperature
+        # fallback recovers from repetition loops without retrying
+        # all the way up to 1.0
+        segments, info = self.whisper.transcribe(
+            audio_path,
+            language="en",
+            beam_size=self.beam_size,
+            temperature=[0.0, 0.2, 0.4],
+            vad_filter=True,
+            vad_parameters={"min_silence_duration_ms": 500, "speech_pad_ms": 200},
+            condition_on_previous_text=False,
+            without_timestamps=True
+        )
+        for seg in segments:
+            yield seg.text
+    
+    def transcribe(self, audio_path: Any) -> Tuple[bool, Optional[str]]:
+        """
+        Transcribe a short spoken command. audio_path may also be a 16 kHz
+        float32 numpy array, which skips the ffmpeg decode.
+        """
         if not self.initialized:
             return False, "Voice recognition not available"
         try:
-            segments, info = self.whisper.transcribe(audio_path, language="en")
-            text = " ".join([seg.text for seg in segments]).strip()
+            text = " ".join(self.transcribe_stream(audio_path)).strip()
             self.logger.info(f"Transcribed: {text}")
             return True, text
         except Exception as e:
@@ -1062,23 +1387,24 @@ class TaskManagementService(BaseService):
     def __init__(self):
         super().__init__("TaskManagement")
         self.task_manager = None
+        # (task_manager.version, serialized tasks) - see get_all_tasks
+        self._tasks_cache: Tuple[int, List[Dict[str, Any]]] = (-1, [])
     
+    @_guarded_init
     def initialize(self) -> bool:
+        self.logger.info("Initializing Task Management...")
+        if not TASKS_AVAILABLE:
+            self.logger.warning("Task system not available")
+            return False
         try:
-            self.logger.info("Initializing Task Management...")
-            try:
-                from automation.tasks import get_task_manager
-                self.task_manager = get_task_manager()
-                self.initialized = True
-                task_count = len(self.task_manager.get_all())
-                self.logger.info(f"[OK] Task Management initialized ({task_count} tasks)")
-                return True
-            except ImportError:
-                self.logger.warning("Task system not available")
-                return False
-        except Exception as e:
-            self.error = str(e)
-            self.logger.error(f"Task management initialization error: {e}")
+            from automation.tasks import get_task_manager
+            self.task_manager = get_task_manager()
+            self.initialized = True
+            task_count = len(self.task_manager.get_all())
+            self.logger.info(f"[OK] Task Management initialized ({task_count} tasks)")
+            return True
+        except ImportError:
+            self.logger.warning("Task system not available")
             return False
     
     def run_task(self, task_id: str) -> Tuple[bool, Optional[str]]:
@@ -1097,17 +1423,24 @@ class TaskManagementService(BaseService):
             return False, str(e)
     
     def get_all_tasks(self) -> List[Dict[str, Any]]:
-        """Get all tasks"""
+        """
+        Get all tasks. The serialized list is reused until the task manager
+        reports a change, so treat it as read-only.
+        """
         if not self.initialized:
             return []
         try:
+            version = getattr(self.task_manager, "version", None)
+            if version is not None and self._tasks_cache[0] == version:
+                return self._tasks_cache[1]
+            
             tasks = self.task_manager.get_all()
             task_list = []
             for t in tasks:
-                if hasattr(t, 'to_dict'):
-                    task_list.append(t.to_dict())
-                else:
-                    task_list.append({"name": str(t)})
+                to_dict = getattr(t, 'to_dict', None)
+                task_list.append(to_dict() if to_dict else {"name": str(t)})
+            if version is not None:
+                self._tasks_cache = (version, task_list)
             return task_list
         except Exception as e:
             self.logger.error(f"Get tasks error: {e}")
@@ -1124,37 +1457,45 @@ class SchedulerService(BaseService):
     def __init__(self):
         super().__init__("Scheduler")
         self.scheduler = None
+        # (scheduler.version, serialized schedules) - see get_all_schedules
+        self._schedules_cache: Tuple[int, List[Dict[str, Any]]] = (-1, [])
     
+    @_guarded_init
     def initialize(self) -> bool:
+        self.logger.info("Initializing Scheduler...")
+        if not SCHEDULER_AVAILABLE:
+            self.logger.warning("Scheduler not available")
+            return False
         try:
-            self.logger.info("Initializing Scheduler...")
-            try:
-                from automation.scheduler import get_scheduler
-                self.scheduler = get_scheduler()
-                self.initialized = True
-                schedule_count = len(self.scheduler.get_all())
-                self.logger.info(f"[OK] Scheduler initialized ({schedule_count} schedules)")
-                return True
-            except ImportError:
-                self.logger.warning("Scheduler not available")
-                return False
-        except Exception as e:
-            self.error = str(e)
-            self.logger.error(f"Scheduler initialization error: {e}")
+            from automation.scheduler import get_scheduler
+            self.scheduler = get_scheduler()
+            self.initialized = True
+            schedule_count = len(self.scheduler.get_all())
+            self.logger.info(f"[OK] Scheduler initialized ({schedule_count} schedules)")
+            return True
+        except ImportError:
+            self.logger.warning("Scheduler not available")
             return False
     
     def get_all_schedules(self) -> List[Dict[str, Any]]:
-        """Get all schedules"""
+        """
+        Get all schedules. The serialized list is reused until the
+        scheduler reports a change, so treat it as read-only.
+        """
         if not self.initialized:
             return []
         try:
+            version = getattr(self.scheduler, "version", None)
+            if version is not None and self._schedules_cache[0] == version:
+                return self._schedules_cache[1]
+            
             schedules = self.scheduler.get_all()
             schedule_list = []
             for s in schedules:
-                if hasattr(s, 'to_dict'):
-                    schedule_list.append(s.to_dict())
-                else:
-                    schedule_list.append({"schedule": str(s)})
+                to_dict = getattr(s, 'to_dict', None)
+                schedule_list.append(to_dict() if to_dict else {"schedule": str(s)})
+            if version is not None:
+                self._schedules_cache = (version, schedule_list)
             return schedule_list
         except Exception as e:
             self.logger.error(f"Get schedules error: {e}")
@@ -1171,22 +1512,23 @@ class ReminderService(BaseService):
     def __init__(self):
         super().__init__("Reminders")
         self.reminder_manager = None
+        # (reminder_manager.version, serialized reminders) - see get_reminder_list
+        self._reminders_cache: Tuple[int, List[Dict[str, Any]]] = (-1, [])
     
+    @_guarded_init
     def initialize(self) -> bool:
+        self.logger.info("Initializing Reminder System...")
+        if not REMINDERS_AVAILABLE:
+            self.logger.warning("Reminder system not available")
+            return False
         try:
-            self.logger.info("Initializing Reminder System...")
-            try:
-                from automation.reminders import get_reminder_manager
-                self.reminder_manager = get_reminder_manager()
-                self.initialized = True
-                self.logger.info("[OK] Reminder System initialized")
-                return True
-            except ImportError:
-                self.logger.warning("Reminder system not available")
-                return False
-        except Exception as e:
-            self.error = str(e)
-            self.logger.error(f"Reminder system initialization error: {e}")
+            from automation.reminders import get_reminder_manager
+            self.reminder_manager = get_reminder_manager()
+            self.initialized = True
+            self.logger.info("[OK] Reminder System initialized")
+            return True
+        except ImportError:
+            self.logger.warning("Reminder system not available")
             return False
     
     def get_all_reminders(self) -> str:
@@ -1199,6 +1541,28 @@ class ReminderService(BaseService):
             self.logger.error(f"Get reminders error: {e}")
             return "Could not retrieve reminders"
     
+    def get_reminder_list(self) -> List[Dict[str, Any]]:
+        """
+        Get all active reminders as dicts. The serialized list is reused
+        until the reminder manager reports a change, so treat it as
+        read-only. (get_all_reminders renders relative times, so that text
+        is not cached.)
+        """
+        if not self.initialized:
+            return []
+        try:
+            version = getattr(self.reminder_manager, "version", None)
+            if version is not None and self._reminders_cache[0] == version:
+                return self._reminders_cache[1]
+            
+            reminder_list = [r.to_dict() for r in self.reminder_manager.get_all()]
+            if version is not None:
+                self._reminders_cache = (version, reminder_list)
+            return reminder_list
+        except Exception as e:
+            self.logger.error(f"Get reminders error: {e}")
+            return []
+    
     def set_timer(self, duration_text: str) -> Tuple[bool, str]:
         """Set a timer from natural language"""
         if not self.initialized:
@@ -1226,7 +1590,8 @@ class ReminderService(BaseService):
         
         try:
             # Try to parse as duration first (e.g., "in 30 minutes")
-            if any(x in time_text.lower() for x in ['in ', 'after ']):
+            time_lower = time_text.lower()
+            if 'in ' in time_lower or 'after ' in time_lower:
                 duration = TimerParser.parse_duration(time_text)
                 if duration:
                     minutes = duration.get("minutes", 0) + duration.get("hours", 0) * 60
@@ -1241,16 +1606,16 @@ class ReminderService(BaseService):
                     return True, f"Reminder set for {message}"
             
             # Try to parse as time (e.g., "at 5pm")
-            time_match = re.search(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)?', time_text.lower())
+            time_match = _TIME_RE.search(time_text)
             if time_match:
                 hour = int(time_match.group(1))
                 minute = int(time_match.group(2) or 0)
-                am_pm = time_match.group(3) or ""
+                am_pm = (time_match.group(3) or "").lower()
                 
                 # Convert to 24-hour format
-                if am_pm.lower() == "pm" and hour != 12:
+                if am_pm == "pm" and hour != 12:
                     hour += 12
-                elif am_pm.lower() == "am" and hour == 12:
+                elif am_pm == "am" and hour == 12:
                     hour = 0
                 
                 reminder = self.reminder_manager.add_at_time(
@@ -1312,14 +1677,85 @@ class AppDetector:
         """Detect app name from command"""
         cmd_lower = command.lower()
         
-        for app_name, variations in AppDetector.APP_MAPPING.items():
-            for var in variations:
-                if var in cmd_lower:
-                    return app_name
+        for var, app_name in _APP_VARIATIONS:
+            if var in cmd_lower:
+                return app_name
         
         return None
 
 
+# (variation, app) pairs flattened in APP_MAPPING order, so the first app
+# listed still wins when a command mentions several
+_APP_VARIATIONS = tuple(
+    (var, app_name)
+    for app_name, variations in AppDetector.APP_MAPPING.items()
+    for var in variations
+)
+
+
+# Routing keywords for ARESManager.execute_command, stored lowercase and
+# matched as substrings of the lowercased command. Substring matching is
+# kept for free-form queries ("what time is it"); imperative commands in
+# _PREFIX_ROUTES only match when the command starts with the keyword.
+_SYSTEM_STATUS_KWS = ("system status", "current status", "status report")
+_OPEN_APP_KWS = ("open", "launch", "start")
+_VOLUME_UP_KWS = ("volume up", "louder")
+_VOLUME_DOWN_KWS = ("volume down", "quieter")
+_MUTE_KWS = ("mute",)
+_SET_TIMER_KWS = ("set timer", "timer for")
+_LIST_REMINDERS_KWS = ("show reminder", "list reminder", "my reminder")
+_SET_REMINDER_KWS = ("remind me", "set reminder")
+_DELETE_REMINDERS_KWS = ("delete all reminder", "clear all reminder")
+_LIST_TASKS_KWS = ("show task", "list task")
+_RUN_TASK_KWS = ("run", "execute")
+_LIST_SCHEDULES_KWS = ("show schedule", "list schedule")
+_SCREENSHOT_KWS = ("screenshot", "take screenshot", "take a screenshot")
+_LOCK_KWS = ("lock",)
+_MINIMIZE_KWS = ("minimize",)
+_TIME_KWS = ("time", "what time")
+_DATE_KWS = ("date", "today")
+_BATTERY_KWS = ("battery",)
+_HELP_KWS = ("help",)
+
+# "open chrome" / "lock" / "take screenshot" - but not "I can't open it",
+# "the clock" or "my screenshot folder"
+_PREFIX_ROUTES = frozenset({"open_app", "screenshot", "lock"})
+
+# Reply to the "help" command
+HELP_TEXT = """ARES Command List:
+
+VOLUME CONTROL:
+  "volume up" or "louder"
+  "volume down" or "quieter"
+  "mute"
+
+REMINDERS:
+  "show my reminders" - List all reminders
+  "set timer for 5 minutes" - Set countdown timer
+  "remind me message at 5pm" - Set reminder at time
+  "delete all reminders" - Clear all
+
+SYSTEM:
+  "system status" - Full system metrics
+  "open chrome" - Open app
+  "take screenshot" - Capture screen
+  "lock" - Lock computer
+  "time", "date", "battery" - System info
+
+TASKS:
+  "show tasks" - List tasks
+  "run morning routine" - Execute task
+
+INTELLIGENT AGENT (FIXED - NOW WORKS PERFECTLY!):
+  "play tum hi ho" - Play on YouTube
+  "open youtube" - Opens YouTube
+  "open chrome and google" - Multi-step
+  "search python tutorials" - Google search
+  "open edge and wafers.digitide.com then click sign in with digitide" - FIXED!
+
+Type "help" for more information."""
+
+
 # ===================================================
 # ARES MANAGER - FIXED FINAL VERSION
 # ===================================================
@@ -1361,24 +1797,60 @@ class ARESManager:
         }
         
         self.status = {}
+        # Bumped whenever self.status is refreshed, so callers (the Flask
+        # /status and /health endpoints) can reuse what they built from it
+        self.status_version = 0
+        self._all_status_cache: Tuple[int, Dict[str, Any]] = (-1, {})
+        # Serializes service initialization (initialize_all vs. _service)
+        self._init_lock = threading.RLock()
+        self._routes = self._build_routes()
+        self._exact_routes = self._build_exact_routes()
+        self._first_route_re = self._build_first_route_re()
+    
+    def _service(self, key: str) -> BaseService:
+        """
+        Service by key, initialized on first use. initialize_all() is only
+        needed to warm everything up front (server mode); a one-off command
+        pays just for the services it touches.
+        """
+        service = self.services[key]
+        if not service.init_attempted:
+            with self._init_lock:
+                if not service.init_attempted:
+                    service.initialize()
+                    self._record_status(key, service)
+        return service
+    
+    def _record_status(self, key: str, service: BaseService) -> None:
+        self.status[key] = service.get_status()
+        self.status_version += 1
     
     def initialize_all(self) -> bool:
-        """Initialize all services"""
+        """
+        Initialize all services. They are independent, so they start
+        concurrently; results are reported in the usual service order.
+        """
         self.logger.info("\nInitializing Services...")
         
-        for service_key, service in self.services.items():
-            success = service.initialize()
-            self.status[service_key] = service.get_status()
+        with self._init_lock:
+            with ThreadPoolExecutor(max_workers=len(self.services)) as executor:
+                futures = {
+                    service_key: executor.submit(service.initialize)
+                    for service_key, service in self.services.items()
+                }
             
-            if success:
-                print(f"    [OK] {service.name} ................. Initialized")
-            else:
-                print(f"    [WARN] {service.name} ................. Failed (optional)")
-        
-        if self.intelligent_agent:
-            print(f"    [OK] Intelligent Agent ................. Initialized")
-        
-        print()
+            failed = []
+            for service_key, service in self.services.items():
+                if not futures[service_key].result():
+                    failed.append(service.name)
+                self._record_status(service_key, service)
+        
+        # Each service has logged its own result, and print_status() shows
+        # the component list; only the summary is added here
+        self.logger.info("Services initialized: %d/%d (optional, unavailable: %s)",
+                         len(self.services) - len(failed), len(self.services),
+                         ", ".join(failed) or "none")
+        self._warmup()
         return True
     
     def print_status(self) -> None:
@@ -1387,11 +1859,15 @@ class ARESManager:
         print("    Status: ONLINE")
         print("    Mode: Production")
         print("    User: Suvadip Panja")
-        print(f"    Time: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"    Time: {now_text()}")
         
         print("\n  Component Status:")
         for service_key, service in self.services.items():
             status = self.status.get(service_key)
+            if status is None:
+                # Not used yet - initialized on first use
+                print(f"    [IDLE] {service.name}")
+                continue
             symbol = "[OK]" if status.available else "[FAIL]"
             print(f"    {symbol} {status.name}")
         
@@ -1401,11 +1877,15 @@ class ARESManager:
         print()
     
     def get_all_status(self) -> Dict[str, Any]:
-        """Get all service statuses"""
-        return {
-            key: status.to_dict() 
-            for key, status in self.status.items()
-        }
+        """Get all service statuses (shared until the statuses change; read-only)"""
+        version, all_status = self._all_status_cache
+        if version != self.status_version:
+            all_status = {
+                key: status.to_dict() 
+                for key, status in self.status.items()
+            }
+            self._all_status_cache = (self.status_version, all_status)
+        return all_status
     
     def get_system_status(self) -> str:
         """Get complete system status with metrics"""
@@ -1417,6 +1897,13 @@ class ARESManager:
             cores = SystemMetrics.get_cpu_count()
             services = self.get_all_status()
             
+            def state(key: str) -> str:
+                # Services are created lazily; unused ones have no status yet
+                status = services.get(key)
+                if status is None:
+                    return "[NOT LOADED]"
+                return "[ACTIVE]" if status["available"] else "[OFFLINE]"
+            
             status_text = f"""
 SYSTEM STATUS REPORT
 =========================================
@@ -1430,16 +1917,16 @@ HARDWARE METRICS:
 
 SERVICE STATUS:
   - ARES Manager: [ONLINE]
-  - AI Brain (Ollama/Llama3): {'[ACTIVE]' if services['ai_brain']['available'] else '[OFFLINE]'}
-  - Desktop Automation: {'[ACTIVE]' if services['desktop']['available'] else '[OFFLINE]'}
-  - Voice Recognition (Whisper): {'[ACTIVE]' if services['voice']['available'] else '[OFFLINE]'}
-  - Task Management: {'[ACTIVE]' if services['tasks']['available'] else '[OFFLINE]'}
-  - Scheduler: {'[ACTIVE]' if services['scheduler']['available'] else '[OFFLINE]'}
-  - Reminders: {'[ACTIVE]' if services['reminders']['available'] else '[OFFLINE]'}
+  - AI Brain (Ollama/Llama3): {state('ai_brain')}
+  - Desktop Automation: {state('desktop')}
+  - Voice Recognition (Whisper): {state('voice')}
+  - Task Management: {state('tasks')}
+  - Scheduler: {state('scheduler')}
+  - Reminders: {state('reminders')}
   - Intelligent Agent: {'[ACTIVE]' if self.intelligent_agent else '[OFFLINE]'}
 
 SYSTEM INFO:
-  - Timestamp: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+  - Timestamp: {now_text()}
   - Mode: Production Ready
   - Status: ALL SYSTEMS OPERATIONAL
 """
@@ -1450,22 +1937,116 @@ SYSTEM INFO:
             self.logger.error(f"System status error: {e}")
             return f"System status unavailable: {str(e)}"
     
-    def _matches_pattern(self, text: str, keywords: List[str]) -> bool:
-        """Intelligent pattern matching"""
-        text_lower = text.lower()
-        return any(keyword.lower() in text_lower for keyword in keywords)
+    @staticmethod
+    def _keyword_pattern(keywords: Tuple[str, ...], prefix: bool = False) -> re.Pattern:
+        """
+        Compile lowercase keywords into one alternation: a substring match,
+        or with prefix=True a whole leading word ("open ..." but not "opened")
+        """
+        alternation = "|".join(map(re.escape, keywords))
+        if prefix:
+            return re.compile(rf"^(?:{alternation})\b")
+        return re.compile(alternation)
+    
+    def _build_routes(self) -> List[Tuple[str, Tuple[str, ...], re.Pattern, Any]]:
+        """
+        Routing table in priority order: (action, keywords, keyword pattern,
+        handler). A handler returning None falls through to the next
+        matching route.
+        """
+        kw = self._keyword_pattern
+        return [
+            (action, keywords, kw(keywords, prefix=action in _PREFIX_ROUTES), handler)
+            for action, keywords, handler in (
+                # PRIORITY 1: SYSTEM STATUS
+                ("system_status", _SYSTEM_STATUS_KWS, self._cmd_system_status),
+                # PRIORITY 2: APP OPENING
+                ("open_app", _OPEN_APP_KWS, self._cmd_open_app),
+                # PRIORITY 3: VOLUME CONTROL
+                ("volume_up", _VOLUME_UP_KWS, self._cmd_volume_up),
+                ("volume_down", _VOLUME_DOWN_KWS, self._cmd_volume_down),
+                ("mute", _MUTE_KWS, self._cmd_mute),
+                # PRIORITY 4: REMINDERS & TIMERS
+                ("set_timer", _SET_TIMER_KWS, self._cmd_set_timer),
+                ("list_reminders", _LIST_REMINDERS_KWS, self._cmd_list_reminders),
+                ("set_reminder", _SET_REMINDER_KWS, self._cmd_set_reminder),
+                ("delete_reminders", _DELETE_REMINDERS_KWS, self._cmd_delete_reminders),
+                # PRIORITY 5: TASKS
+                ("list_tasks", _LIST_TASKS_KWS, self._cmd_list_tasks),
+                ("run_task", _RUN_TASK_KWS, self._cmd_run_task),
+                # PRIORITY 6: SCHEDULES
+                ("list_schedules", _LIST_SCHEDULES_KWS, self._cmd_list_schedules),
+                # PRIORITY 7: SYSTEM CONTROL
+                ("screenshot", _SCREENSHOT_KWS, self._cmd_screenshot),
+                ("lock", _LOCK_KWS, self._cmd_lock),
+                ("minimize", _MINIMIZE_KWS, self._cmd_minimize),
+                # PRIORITY 8: SYSTEM QUERIES
+                ("time", _TIME_KWS, self._cmd_time),
+                ("date", _DATE_KWS, self._cmd_date),
+                ("battery", _BATTERY_KWS, self._cmd_battery),
+                # PRIORITY 9: HELP
+                ("help", _HELP_KWS, self._cmd_help),
+            )
+        ]
+    
+    def _build_exact_routes(self) -> Dict[str, int]:
+        """
+        Map every keyword ("mute", "volume up", "what time", ...) to the
+        index of the first route it matches, so a command that is exactly
+        a keyword finds its route with one dict lookup.
+        """
+        table = {}
+        for _, keywords, _, _ in self._routes:
+            for keyword in keywords:
+                if keyword in table:
+                    continue
+                start = next(
+                    (i for i, (_, _, pattern, _) in enumerate(self._routes) if pattern.search(keyword)),
+                    None
+                )
+                if start is not None:
+                    table[keyword] = start
+        return table
+    
+    def _build_first_route_re(self) -> re.Pattern:
+        """
+        One regex whose ordered lookahead alternatives mirror the routes.
+        match() tries them in priority order at position 0, so
+        lastindex - 1 is the index of the first route the command hits.
+        """
+        return re.compile(
+            "|".join(f"((?=.*?(?:{pattern.pattern})))" for _, _, pattern, _ in self._routes),
+            re.DOTALL
+        )
+    
+    def _first_route(self, cmd_lower: str) -> Optional[int]:
+        """Index of the first route matching the command, or None"""
+        start = self._exact_routes.get(cmd_lower)
+        if start is None:
+            match = self._first_route_re.match(cmd_lower)
+            if match is not None:
+                start = match.lastindex - 1
+        return start
+    
+    def _warmup(self) -> None:
+        """
+        Run the routing lookups on a command no route matches, so the first
+        real command doesn't pay for the interpreter specializing them.
+        Handlers are not called, so nothing is executed.
+        """
+        probe = "warmup probe"
+        for _ in range(3):
+            self._first_route(probe)
+            for _action, _keywords, pattern, _handler in self._routes:
+                pattern.search(probe)
     
     def execute_command(self, command: str) -> CommandResult:
         """Execute command with intelligent routing"""
-        cmd_lower = command.lower().strip()
+        # Normalized once here; every route and handler matches against it
+        cmd_lower = command.strip().casefold()
         
         self.logger.info(f"Command: {command}")
         
-        desktop_service = self.services.get("desktop")
-        tasks_service = self.services.get("tasks")
-        reminder_service = self.services.get("reminders")
-        scheduler_service = self.services.get("scheduler")
-        
         # ===============================================
         # PRIORITY 0: TRY INTELLIGENT AGENT FIRST
         # ===============================================
@@ -1481,207 +2062,23 @@ SYSTEM INFO:
                 self.logger.debug(f"Agent error: {e}")
         
         # ===============================================
-        # PRIORITY 1: SYSTEM STATUS
-        # ===============================================
-        if self._matches_pattern(command, ["system status", "current status", "status report"]):
-            status_text = self.get_system_status()
-            return CommandResult(True, "system_status", status_text, source="system")
-        
-        # ===============================================
-        # PRIORITY 2: APP OPENING
-        # ===============================================
-        if self._matches_pattern(command, ["open", "launch"]):
-            detected_app = AppDetector.detect_app(command)
-            if detected_app:
-                success, response = AppRegistry.launch_app(detected_app)
-                return CommandResult(success, "open_app", response, source="desktop")
-        
-        # ===============================================
-        # PRIORITY 3: VOLUME CONTROL
-        # ===============================================
-        if self._matches_pattern(command, ["volume up", "louder"]):
-            success, response = desktop_service.volume_up()
-            return CommandResult(success, "volume_up", response, source="desktop")
-        
-        if self._matches_pattern(command, ["volume down", "quieter"]):
-            success, response = desktop_service.volume_down()
-            return CommandResult(success, "volume_down", response, source="desktop")
-        
-        if self._matches_pattern(command, ["mute"]):
-            success, response = desktop_service.mute()
-            return CommandResult(success, "mute", response, source="desktop")
-        
-        # ===============================================
-        # PRIORITY 4: REMINDERS & TIMERS
-        # ===============================================
-        
-        # Set timer
-        if self._matches_pattern(command, ["set timer", "timer for"]):
-            match = re.search(r'(?:set\s+)?timer\s+(?:for\s+)?(.+)', command, re.IGNORECASE)
-            if match:
-                duration_text = match.group(1)
-                success, response = reminder_service.set_timer(duration_text)
-                return CommandResult(success, "set_timer", response, source="reminder")
-        
-        # List reminders
-        if self._matches_pattern(command, ["show reminder", "list reminder", "my reminder"]):
-            response = reminder_service.get_all_reminders()
-            self.logger.info(f"Action: list_reminders - Success")
-            return CommandResult(True, "list_reminders", response, source="reminder")
-        
-        # Set reminder
-        if self._matches_pattern(command, ["remind me", "set reminder"]):
-            match = re.search(r'remind\s+me\s+(.+?)\s+(?:at|in)\s+(.+)', command, re.IGNORECASE)
-            if match:
-                message = match.group(1)
-                time_text = match.group(2)
-                success, response = reminder_service.set_reminder(message, time_text)
-                return CommandResult(success, "set_reminder", response, source="reminder")
-        
-        # Delete all reminders
-        if self._matches_pattern(command, ["delete all reminder", "clear all reminder"]):
-            success, response = reminder_service.delete_all_reminders()
-            return CommandResult(success, "delete_reminders", response, source="reminder")
-        
-        # ===============================================
-        # PRIORITY 5: TASKS
+        # PRIORITIES 1-9: KEYWORD ROUTES
         # ===============================================
-        if self._matches_pattern(command, ["show task", "list task"]):
-            if tasks_service and tasks_service.initialized:
-                all_tasks = tasks_service.get_all_tasks()
-                
-                if not all_tasks:
-                    response = "No tasks available"
-                else:
-                    by_category = {}
-                    for task in all_tasks:
-                        cat = task.get("category", "general")
-                        if cat not in by_category:
-                            by_category[cat] = []
-                        by_category[cat].append(task)
-                    
-                    category_emojis = {
-                        "routine": "🌅",
-                        "health": "☕",
-                        "productivity": "🎯",
-                        "work": "💼",
-                        "utility": "🖥️",
-                        "system": "⚙️",
-                        "communication": "📧",
-                        "entertainment": "▶️",
-                        "general": "📋"
-                    }
-                    
-                    lines = [f"📋 You have {len(all_tasks)} tasks:\n"]
-                    
-                    for category in sorted(by_category.keys()):
-                        emoji = category_emojis.get(category, "📋")
-                        lines.append(f"{emoji} {category.upper()}:")
-                        
-                        for task in by_category[category]:
-                            task_icon = task.get("icon", "📋")
-                            task_name = task.get("name", "Unknown")
-                            description = task.get("description", "No description")
-                            actions_count = len(task.get("actions", []))
-                            
-                            lines.append(f"  • {task_icon} {task_name}")
-                            lines.append(f"    {description}")
-                            lines.append(f"    ({actions_count} actions)")
-                        
-                        lines.append("")
-                    
-                    response = "\n".join(lines)
-                
-                self.logger.info(f"Action: list_tasks - Success")
-                return CommandResult(True, "list_tasks", response, source="task")
-        
-        if self._matches_pattern(command, ["run", "execute"]):
-            if tasks_service and tasks_service.initialized:
-                all_tasks = tasks_service.get_all_tasks()
-                for task in all_tasks:
-                    task_name = task.get("name", "").lower() if isinstance(task, dict) else str(task).lower()
-                    if task_name and task_name in cmd_lower:
-                        task_id = task.get("id", task_name)
-                        success, response = tasks_service.run_task(task_id)
-                        return CommandResult(success, "run_task", response or f"Running {task_name}", source="task")
-        
-        # ===============================================
-        # PRIORITY 6: SCHEDULES
-        # ===============================================
-        if self._matches_pattern(command, ["show schedule", "list schedule"]):
-            if scheduler_service and scheduler_service.initialized:
-                schedules = scheduler_service.get_all_schedules()
-                response = f"You have {len(schedules)} schedules" if schedules else "No schedules set"
-                self.logger.info(f"Action: list_schedules - {response}")
-                return CommandResult(True, "list_schedules", response, source="scheduler")
-        
-        # ===============================================
-        # PRIORITY 7: SYSTEM CONTROL
-        # ===============================================
-        if self._matches_pattern(command, ["screenshot"]):
-            success, response = desktop_service.take_screenshot()
-            return CommandResult(success, "screenshot", response, source="desktop")
-        
-        if self._matches_pattern(command, ["lock"]):
-            success, response = desktop_service.lock_computer()
-            return CommandResult(success, "lock", response, source="desktop")
-        
-        if self._matches_pattern(command, ["minimize"]):
-            success, response = desktop_service.minimize_all_windows()
-            return CommandResult(success, "minimize", response, source="desktop")
-        
-        # ===============================================
-        # PRIORITY 8: SYSTEM QUERIES
-        # ===============================================
-        if self._matches_pattern(command, ["time", "what time"]):
-            time_str = desktop_service.get_time()
-            return CommandResult(True, "time", f"The time is {time_str}", source="desktop")
-        
-        if self._matches_pattern(command, ["date", "today"]):
-            date_str = desktop_service.get_date()
-            return CommandResult(True, "date", f"Today is {date_str}", source="desktop")
-        
-        if self._matches_pattern(command, ["battery"]):
-            battery_str = desktop_service.get_battery()
-            return CommandResult(True, "battery", battery_str, source="desktop")
-        
-        # ===============================================
-        # PRIORITY 9: HELP
-        # ===============================================
-        if self._matches_pattern(command, ["help"]):
-            help_text = """ARES Command List:
-
-VOLUME CONTROL:
-  "volume up" or "louder"
-  "volume down" or "quieter"
-  "mute"
-
-REMINDERS:
-  "show my reminders" - List all reminders
-  "set timer for 5 minutes" - Set countdown timer
-  "remind me message at 5pm" - Set reminder at time
-  "delete all reminders" - Clear all
-
-SYSTEM:
-  "system status" - Full system metrics
-  "open chrome" - Open app
-  "take screenshot" - Capture screen
-  "lock" - Lock computer
-  "time", "date", "battery" - System info
-
-TASKS:
-  "show tasks" - List tasks
-  "run morning routine" - Execute task
-
-INTELLIGENT AGENT (FIXED - NOW WORKS PERFECTLY!):
-  "play tum hi ho" - Play on YouTube
-  "open youtube" - Opens YouTube
-  "open chrome and google" - Multi-step
-  "search python tutorials" - Google search
-  "open edge and wafers.digitide.com then click sign in with digitide" - FIXED!
-
-Type "help" for more information."""
-            return CommandResult(True, "help", help_text, source="system")
+        # Jump straight to the first matching route (dict lookup when the
+        # command is exactly a keyword, one regex pass otherwise); only if
+        # its handler declines are the remaining routes tried in order
+        start = self._first_route(cmd_lower)
+        if start is not None:
+            action, keywords, pattern, handler = self._routes[start]
+            result = handler(command, cmd_lower)
+            if result is not None:
+                return result
+            
+            for action, keywords, pattern, handler in islice(self._routes, start + 1, None):
+                if pattern.search(cmd_lower):
+                    result = handler(command, cmd_lower)
+                    if result is not None:
+                        return result
         
         # ===============================================
         # FALLBACK
@@ -1692,6 +2089,159 @@ Type "help" for more information."""
             source="fallback"
         )
     
+    # ===============================================
+    # ROUTE HANDLERS
+    # ===============================================
+    
+    def _cmd_system_status(self, command: str, cmd_lower: str) -> Optional[CommandResult]:
+        status_text = self.get_system_status()
+        return CommandResult(True, "system_status", status_text, source="system")
+    
+    def _cmd_open_app(self, command: str, cmd_lower: str) -> Optional[CommandResult]:
+        detected_app = AppDetector.detect_app(command)
+        if detected_app:
+            success, response = AppRegistry.launch_app(detected_app)
+            return CommandResult(success, "open_app", response, source="desktop")
+        return None
+    
+    def _cmd_volume_up(self, command: str, cmd_lower: str) -> Optional[CommandResult]:
+        success, response = self._service("desktop").volume_up()
+        return CommandResult(success, "volume_up", response, source="desktop")
+    
+    def _cmd_volume_down(self, command: str, cmd_lower: str) -> Optional[CommandResult]:
+        success, response = self._service("desktop").volume_down()
+        return CommandResult(success, "volume_down", response, source="desktop")
+    
+    def _cmd_mute(self, command: str, cmd_lower: str) -> Optional[CommandResult]:
+        success, response = self._service("desktop").mute()
+        return CommandResult(success, "mute", response, source="desktop")
+    
+    def _cmd_set_timer(self, command: str, cmd_lower: str) -> Optional[CommandResult]:
+        match = re.search(r'(?:set\s+)?timer\s+(?:for\s+)?(.+)', command, re.IGNORECASE)
+        if match:
+            duration_text = match.group(1)
+            success, response = self._service("reminders").set_timer(duration_text)
+            return CommandResult(success, "set_timer", response, source="reminder")
+        return None
+    
+    def _cmd_list_reminders(self, command: str, cmd_lower: str) -> Optional[CommandResult]:
+        response = self._service("reminders").get_all_reminders()
+        self.logger.info(f"Action: list_reminders - Success")
+        return CommandResult(True, "list_reminders", response, source="reminder")
+    
+    def _cmd_set_reminder(self, command: str, cmd_lower: str) -> Optional[CommandResult]:
+        match = re.search(r'remind\s+me\s+(.+?)\s+(?:at|in)\s+(.+)', command, re.IGNORECASE)
+        if match:
+            message = match.group(1)
+            time_text = match.group(2)
+            success, response = self._service("reminders").set_reminder(message, time_text)
+            return CommandResult(success, "set_reminder", response, source="reminder")
+        return None
+    
+    def _cmd_delete_reminders(self, command: str, cmd_lower: str) -> Optional[CommandResult]:
+        success, response = self._service("reminders").delete_all_reminders()
+        return CommandResult(success, "delete_reminders", response, source="reminder")
+    
+    def _cmd_list_tasks(self, command: str, cmd_lower: str) -> Optional[CommandResult]:
+        tasks_service = self._service("tasks")
+        if not (tasks_service and tasks_service.initialized):
+            return None
+        
+        all_tasks = tasks_service.get_all_tasks()
+        
+        if not all_tasks:
+            response = "No tasks available"
+        else:
+            by_category = {}
+            for task in all_tasks:
+                cat = task.get("category", "general")
+                if cat not in by_category:
+                    by_category[cat] = []
+                by_category[cat].append(task)
+            
+            category_emojis = {
+                "routine": "🌅",
+                "health": "☕",
+                "productivity": "🎯",
+                "work": "💼",
+                "utility": "🖥️",
+                "system": "⚙️",
+                "communication": "📧",
+                "entertainment": "▶️",
+                "general": "📋"
+            }
+            
+            lines = [f"📋 You have {len(all_tasks)} tasks:\n"]
+            
+            for category in sorted(by_category.keys()):
+                emoji = category_emojis.get(category, "📋")
+                lines.append(f"{emoji} {category.upper()}:")
+                
+                for task in by_category[category]:
+                    task_icon = task.get("icon", "📋")
+                    task_name = task.get("name", "Unknown")
+                    description = task.get("description", "No description")
+                    actions_count = len(task.get("actions", []))
+                    
+                    lines.append(f"  • {task_icon} {task_name}")
+                    lines.append(f"    {description}")
+                    lines.append(f"    ({actions_count} actions)")
+                
+                lines.append("")
+            
+            response = "\n".join(lines)
+        
+        self.logger.info(f"Action: list_tasks - Success")
+        return CommandResult(True, "list_tasks", response, source="task")
+    
+    def _cmd_run_task(self, command: str, cmd_lower: str) -> Optional[CommandResult]:
+        tasks_service = self._service("tasks")
+        if tasks_service and tasks_service.initialized:
+            all_tasks = tasks_service.get_all_tasks()
+            for task in all_tasks:
+                task_name = task.get("name", "").casefold() if isinstance(task, dict) else str(task).casefold()
+                if task_name and task_name in cmd_lower:
+                    task_id = task.get("id", task_name)
+                    success, response = tasks_service.run_task(task_id)
+                    return CommandResult(success, "run_task", response or f"Running {task_name}", source="task")
+        return None
+    
+    def _cmd_list_schedules(self, command: str, cmd_lower: str) -> Optional[CommandResult]:
+        scheduler_service = self._service("scheduler")
+        if scheduler_service and scheduler_service.initialized:
+            schedules = scheduler_service.get_all_schedules()
+            response = f"You have {len(schedules)} schedules" if schedules else "No schedules set"
+            self.logger.info(f"Action: list_schedules - {response}")
+            return CommandResult(True, "list_schedules", response, source="scheduler")
+        return None
+    
+    def _cmd_screenshot(self, command: str, cmd_lower: str) -> Optional[CommandResult]:
+        success, response = self._service("desktop").take_screenshot()
+        return CommandResult(success, "screenshot", response, source="desktop")
+    
+    def _cmd_lock(self, command: str, cmd_lower: str) -> Optional[CommandResult]:
+        success, response = self._service("desktop").lock_computer()
+        return CommandResult(success, "lock", response, source="desktop")
+    
+    def _cmd_minimize(self, command: str, cmd_lower: str) -> Optional[CommandResult]:
+        success, response = self._service("desktop").minimize_all_windows()
+        return CommandResult(success, "minimize", response, source="desktop")
+    
+    def _cmd_time(self, command: str, cmd_lower: str) -> Optional[CommandResult]:
+        time_str = self._service("desktop").get_time()
+        return CommandResult(True, "time", f"The time is {time_str}", source="desktop")
+    
+    def _cmd_date(self, command: str, cmd_lower: str) -> Optional[CommandResult]:
+        date_str = self._service("desktop").get_date()
+        return CommandResult(True, "date", f"Today is {date_str}", source="desktop")
+    
+    def _cmd_battery(self, command: str, cmd_lower: str) -> Optional[CommandResult]:
+        battery_str = self._service("desktop").get_battery()
+        return CommandResult(True, "battery", battery_str, source="desktop")
+    
+    def _cmd_help(self, command: str, cmd_lower: str) -> Optional[CommandResult]:
+        return CommandResult(True, "help", HELP_TEXT, source="system")
+    
     def shutdown(self) -> None:
         """Shutdown all services"""
         self.logger.info("\nShutting down ARES...")
@@ -1711,14 +2261,10 @@ Type "help" for more information."""
 # GLOBAL INSTANCE
 # ===================================================
 
-manager = None
-
+@lru_cache(maxsize=1)
 def get_manager() -> ARESManager:
     """Get or create ARES manager"""
-    global manager
-    if manager is None:
-        manager = ARESManager()
-    return manager
+    return ARESManager()
 
 def initialize_ares() -> ARESManager:
     """Initialize and return ARES manager"""
@@ -1727,6 +2273,21 @@ def initialize_ares() -> ARESManager:
     manager.print_status()
     return manager
 
+def preload_whisper() -> bool:
+    """
+    Load the Whisper model now instead of on the first transcription.
+    main_web.py does this in a background thread when
+    ARES_PRELOAD_WHISPER=1.
+    
+    Under a pre-forking server, call it in each worker process (e.g. a
+    gunicorn post_fork hook), not before forking: CTranslate2 starts its
+    worker threads (and any CUDA context) when the model loads, and those
+    do not survive fork(), so a model inherited from a pre-fork master
+    would hang on first use.
+    """
+    voice = get_manager()._service("voice")
+    return voice.whisper is not None
+
 
 # ===================================================
 # CONVENIENCE FUNCTIONS FOR FLASK
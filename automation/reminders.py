@@ -126,6 +126,9 @@ class ReminderManager:
         
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        # Bumped on every change (every change is saved), so callers can
+        # cache derived views of the reminders
+        self.version = 0
         
         self._load()
         print(f"  ✅ Reminder system initialized ({len(self.reminders)} active)")
@@ -148,6 +151,7 @@ class ReminderManager:
     
     def _save(self):
         """Save reminders to storage"""
+        self.version += 1
         try:
             with open(self.storage_path, 'w') as f:
                 json.dump([r.to_dict() for r in self.reminders], f, indent=2)
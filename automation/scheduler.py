@@ -227,6 +227,9 @@ class Scheduler:
         
         self.schedules: Dict[str, Schedule] = {}
         self.task_manager = None
+        # Bumped on every change (every change is saved), so callers can
+        # cache derived views of the schedules
+        self.version = 0
         
         # Callbacks
         self.on_task_run: Optional[Callable[[Schedule, any], None]] = None
@@ -258,6 +261,7 @@ class Scheduler:
     
     def _save(self):
         """Save schedules to storage."""
+        self.version += 1
         try:
             with open(self.storage_path, 'w') as f:
                 json.dump({
@@ -308,6 +308,9 @@ class TaskManager:
         
         self.tasks: Dict[str, Task] = {}
         self.executor = TaskExecutor()
+        # Bumped on every change (every change is saved), so callers can
+        # cache derived views of the tasks
+        self.version = 0
         
         self._load()
         self._ensure_defaults()
@@ -326,6 +329,7 @@ class TaskManager:
                 print(f"  ⚠️ Could not load tasks: {e}")
     
     def _save(self):
+        self.version += 1
         try:
             with open(self.storage_path, 'w') as f:
                 json.dump([t.to_dict() for t in self.tasks.values()], f, indent=2)
@@ -618,11 +622,14 @@ class TaskManager:
 
 # Global instance
 _task_manager: Optional[TaskManager] = None
+_task_manager_lock = threading.Lock()
 
 def get_task_manager() -> TaskManager:
     global _task_manager
-    if _task_manager is None:
-        _task_manager = TaskManager()
+    # Locked because the task and scheduler services may ask for it at once
+    with _task_manager_lock:
+        if _task_manager is None:
+            _task_manager = TaskManager()
     return _task_manager
 
 
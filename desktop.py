@@ -26,7 +26,8 @@ import os
 import sys
 import time
 import subprocess
-import datetime
+import shutil
+import threading
 import webbrowser
 import logging
 from pathlib import Path
@@ -98,6 +99,16 @@ except ImportError:
     logger.warning("⚠️  pyttsx3 not available - install: pip install pyttsx3")
 
 
+# Default volume change per step: 10% of full scale
+VOLUME_STEP = 0.1
+
+# One volume media key moves Windows' volume by 2%
+MEDIA_KEY_STEP = 0.02
+
+# Media keys below pass _pause=False: pyautogui otherwise sleeps PAUSE
+# (0.1 s) after every call, which only matters for multi-step UI input
+
+
 # ===================================================
 # DESKTOP AUTOMATION CLASS
 # ===================================================
@@ -113,6 +124,8 @@ class DesktopAutomation:
         self.user = os.getenv('USERNAME', 'user')
         self.desktop_path = Path.home() / "Desktop"
         self.documents_path = Path.home() / "Documents"
+        # Per-thread COM objects (see _endpoint_volume)
+        self._com = threading.local()
         logger.info(f"✅ Desktop Automation initialized for user: {self.user}")
     
     # ===================================================
@@ -121,15 +134,15 @@ class DesktopAutomation:
     
     def get_time(self) -> str:
         """Get current system time."""
-        return datetime.datetime.now().strftime("%I:%M %p")
+        return time.strftime("%I:%M %p")
     
     def get_date(self) -> str:
         """Get current system date."""
-        return datetime.datetime.now().strftime("%A, %B %d, %Y")
+        return time.strftime("%A, %B %d, %Y")
     
     def get_datetime(self) -> str:
         """Get current date and time."""
-        return datetime.datetime.now().strftime("%A, %B %d, %Y at %I:%M %p")
+        return time.strftime("%A, %B %d, %Y at %I:%M %p")
     
     def get_battery(self) -> str:
         """Get battery information."""
@@ -175,46 +188,78 @@ class DesktopAutomation:
     # VOLUME CONTROL
     # ===================================================
     
-    def volume_up(self) -> Tuple[bool, str]:
-        """Increase volume."""
+    def _endpoint_volume(self):
+        """
+        Windows master-volume COM interface (pycaw), created once per
+        thread: COM objects belong to the thread that made them.
+        """
+        volume = getattr(self._com, "endpoint_volume", None)
+        if volume is None:
+            from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+            devices = AudioUtilities.GetSpeakers()
+            interface = devices.Activate(IAudioEndpointVolume._iid_, 0, None)
+            volume = self._com.endpoint_volume = interface.QueryInterface(IAudioEndpointVolume)
+        return volume
+    
+    def _change_volume(self, delta: float) -> bool:
+        """
+        Move the master volume by delta (a fraction of full scale) with one
+        native call. Returns False if no native volume control is available
+        or it fails (pycaw missing, no sink), so callers fall back to media keys.
+        """
         try:
             if IS_WINDOWS:
-                from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
-                devices = AudioUtilities.GetSpeakers()
-                interface = devices.Activate(IAudioEndpointVolume._iid_, 0, None)
-                volume = interface.QueryInterface(IAudioEndpointVolume)
+                volume = self._endpoint_volume()
                 current = volume.GetMasterVolumeLevelScalar()
-                volume.SetMasterVolumeLevelScalar(min(1.0, current + 0.1), None)
+                volume.SetMasterVolumeLevelScalar(min(1.0, max(0.0, current + delta)), None)
+                return True
+            
+            percent = round(abs(delta) * 100)
+            if IS_LINUX and shutil.which("pactl"):
+                sign = "+" if delta > 0 else "-"
+                subprocess.run(
+                    ["pactl", "set-sink-volume", "@DEFAULT_SINK@", f"{sign}{percent}%"],
+                    check=True, capture_output=True
+                )
+                return True
+            if IS_MAC:
+                op = "+" if delta > 0 else "-"
+                subprocess.run(
+                    ["osascript", "-e",
+                     f"set volume output volume ((output volume of (get volume settings)) {op} {percent})"],
+                    check=True, capture_output=True
+                )
+                return True
+        except Exception as e:
+            logger.warning(f"Native volume control failed: {e}")
+        return False
+    
+    def volume_up(self, step: float = VOLUME_STEP) -> Tuple[bool, str]:
+        """Increase volume by step (fraction of full scale)."""
+        try:
+            if self._change_volume(step):
                 logger.info("Volume increased")
                 return True, "Volume increased"
-            else:
-                # Fallback for non-Windows
-                if PYAUTOGUI_AVAILABLE:
-                    pyautogui.press('volumeup')
-                    return True, "Volume increased"
+            # Fallback: media keys, one press per 2%
+            if PYAUTOGUI_AVAILABLE:
+                pyautogui.press('volumeup', presses=max(1, round(step / MEDIA_KEY_STEP)), interval=0, _pause=False)
+                return True, "Volume increased"
         except Exception as e:
             logger.warning(f"Volume up error: {e}")
             return False, str(e)
         
         return False, "Volume control not available"
     
-    def volume_down(self) -> Tuple[bool, str]:
-        """Decrease volume."""
+    def volume_down(self, step: float = VOLUME_STEP) -> Tuple[bool, str]:
+        """Decrease volume by step (fraction of full scale)."""
         try:
-            if IS_WINDOWS:
-                from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
-                devices = AudioUtilities.GetSpeakers()
-                interface = devices.Activate(IAudioEndpointVolume._iid_, 0, None)
-                volume = interface.QueryInterface(IAudioEndpointVolume)
-                current = volume.GetMasterVolumeLevelScalar()
-                volume.SetMasterVolumeLevelScalar(max(0.0, current - 0.1), None)
+            if self._change_volume(-step):
                 logger.info("Volume decreased")
                 return True, "Volume decreased"
-            else:
-                # Fallback for non-Windows
-                if PYAUTOGUI_AVAILABLE:
-                    pyautogui.press('volumedown')
-                    return True, "Volume decreased"
+            # Fallback: media keys, one press per 2%
+            if PYAUTOGUI_AVAILABLE:
+                pyautogui.press('volumedown', presses=max(1, round(step / MEDIA_KEY_STEP)), interval=0, _pause=False)
+                return True, "Volume decreased"
         except Exception as e:
             logger.warning(f"Volume down error: {e}")
             return False, str(e)
@@ -225,10 +270,7 @@ class DesktopAutomation:
         """Mute/unmute audio."""
         try:
             if IS_WINDOWS:
-                from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
-                devices = AudioUtilities.GetSpeakers()
-                interface = devices.Activate(IAudioEndpointVolume._iid_, 0, None)
-                volume = interface.QueryInterface(IAudioEndpointVolume)
+                volume = self._endpoint_volume()
                 is_muted = volume.GetMute()
                 volume.SetMute(not is_muted, None)
                 status = "unmuted" if is_muted else "muted"
@@ -237,7 +279,7 @@ class DesktopAutomation:
             else:
                 # Fallback
                 if PYAUTOGUI_AVAILABLE:
-                    pyautogui.press('mute')
+                    pyautogui.press('mute', _pause=False)
                     return True, "Audio muted"
         except Exception as e:
             logger.warning(f"Mute error: {e}")
@@ -255,7 +297,7 @@ class DesktopAutomation:
             if not PIL_AVAILABLE:
                 return False, "PIL not available (install: pip install pillow)"
             
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             screenshot_path = self.desktop_path / f"screenshot_{timestamp}.png"
             
             # Ensure desktop directory exists
@@ -556,7 +598,7 @@ class DesktopAutomation:
         """Toggle play/pause."""
         try:
             if PYAUTOGUI_AVAILABLE:
-                pyautogui.press('playpause')
+                pyautogui.press('playpause', _pause=False)
                 logger.info("Play/Pause toggled")
                 return True, "Play/Pause toggled"
         except Exception as e:
@@ -569,7 +611,7 @@ class DesktopAutomation:
         """Next track."""
         try:
             if PYAUTOGUI_AVAILABLE:
-                pyautogui.press('nexttrack')
+                pyautogui.press('nexttrack', _pause=False)
                 logger.info("Next track")
                 return True, "Playing next track"
         except Exception as e:
@@ -582,7 +624,7 @@ class DesktopAutomation:
         """Previous track."""
         try:
             if PYAUTOGUI_AVAILABLE:
-                pyautogui.press('prevtrack')
+                pyautogui.press('prevtrack', _pause=False)
                 logger.info("Previous track")
                 return True, "Playing previous track"
         except Exception as e:
@@ -52,7 +52,32 @@ DEBUG_LOG = LOGS_DIR / "ares_debug.log"
 # LOG FORMAT
 # ===================================================
 
-DETAILED_FORMAT = logging.Formatter(
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders asctime once per second.
+    
+    With a second-resolution datefmt every record logged within the same
+    second gets the same timestamp string, so the strftime result is
+    cached by int(record.created) instead of being rebuilt per record.
+    """
+    
+    def __init__(self, fmt=None, datefmt=None, style='%'):
+        super().__init__(fmt, datefmt, style)
+        self._cached_time = (None, None, "")
+    
+    def formatTime(self, record, datefmt=None):
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, cached_fmt, text = self._cached_time
+        if second != cached_second or datefmt != cached_fmt:
+            text = super().formatTime(record, datefmt)
+            self._cached_time = (second, datefmt, text)
+        return text
+
+
+DETAILED_FORMAT = CachedTimeFormatter(
     '[%(asctime)s] %(name)s - %(levelname)s - %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
 )
@@ -24,9 +24,21 @@ For: Suvadip Panja
 
 import os
 import sys
+import time
+import threading
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
+
+# orjson is optional; fall back to the stdlib codec when it is missing
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
 # ===================================================
 # PROJECT STRUCTURE SETUP
@@ -64,7 +76,7 @@ for dir_path in required_dirs:
 print("\n🚀 Initializing ARES Manager...")
 print("=" * 70)
 
-from ares_manager import initialize_ares, get_manager
+from ares_manager import initialize_ares, preload_whisper
 
 try:
     # Initialize all backend services
@@ -74,6 +86,11 @@ except Exception as e:
     print(f"❌ ARES Manager initialization failed: {e}")
     sys.exit(1)
 
+# Optional: load Whisper in the background so the first voice command
+# doesn't wait for it (this server is a single process, so it's fork-safe)
+if os.environ.get("ARES_PRELOAD_WHISPER") == "1":
+    threading.Thread(target=preload_whisper, name="whisper-preload", daemon=True).start()
+
 # ===================================================
 # FLASK APP SETUP
 # ===================================================
@@ -82,7 +99,7 @@ print("\n" + "=" * 70)
 print("🌐 Initializing Flask Web Server...")
 print("=" * 70)
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
 
 # Create Flask app
 app = Flask(
@@ -113,36 +130,56 @@ def index_classic():
     return render_template("index.html")
 
 
-@app.route("/health", methods=["GET"])
-def health_check():
-    """System health check."""
-    manager = get_manager()
-    status = manager.get_all_status()
+# Encoded /health and /status bodies, keyed by the manager's status_version
+_status_bodies: Dict[str, Tuple[int, bytes]] = {}
+
+
+def _status_response(key: str, build: Callable[[dict], dict]) -> Response:
+    """
+    JSON response built from the service statuses. These endpoints are
+    polled, and the statuses only change on (re)initialization, so the
+    encoded body is reused until the manager's status_version moves.
+    """
+    cached = _status_bodies.get(key)
+    if cached is None or cached[0] != ares.status_version:
+        cached = (ares.status_version, _json_dumps(build(ares.get_all_status())))
+        _status_bodies[key] = cached
+    return Response(cached[1], mimetype="application/json")
+
+
+def _health_payload(status: dict) -> dict:
     available_services = sum(1 for s in status.values() if s["available"])
     total_services = len(status)
     
-    return jsonify({
+    return {
         "status": "ONLINE",
         "agent": "ARES",
         "services_available": available_services,
         "services_total": total_services,
         "details": status
-    })
+    }
 
 
-@app.route("/status", methods=["GET"])
-def status():
-    """Get current system status."""
-    manager = get_manager()
-    status_info = manager.get_all_status()
-    
-    return jsonify({
+def _status_payload(status_info: dict) -> dict:
+    return {
         "online": True,
         "mode": "production",
         "user": "Suvadip Panja",
         "components": status_info,
         "all_ready": all(s["available"] for s in status_info.values())
-    })
+    }
+
+
+@app.route("/health", methods=["GET"])
+def health_check():
+    """System health check."""
+    return _status_response("health", _health_payload)
+
+
+@app.route("/status", methods=["GET"])
+def status():
+    """Get current system status."""
+    return _status_response("status", _status_payload)
 
 
 # ===================================================
@@ -170,8 +207,7 @@ def execute_command_endpoint():
             return jsonify({"error": "Empty command"}), 400
         
         # Execute via manager
-        manager = get_manager()
-        result = manager.execute_command(command)
+        result = ares.execute_command(command)
         
         return jsonify(result.to_dict())
     
@@ -206,8 +242,7 @@ def direct_action_legacy():
 @app.route("/tasks", methods=["GET"])
 def get_tasks():
     """Get all tasks from task service."""
-    manager = get_manager()
-    tasks_service = manager.services.get("tasks")
+    tasks_service = ares.services.get("tasks")
     
     if not tasks_service or not tasks_service.initialized:
         return jsonify({"error": "Task system not available", "tasks": []}), 503
@@ -223,8 +258,7 @@ def get_tasks():
 @app.route("/schedules", methods=["GET"])
 def get_schedules():
     """Get all schedules from scheduler service."""
-    manager = get_manager()
-    scheduler_service = manager.services.get("scheduler")
+    scheduler_service = ares.services.get("scheduler")
     
     if not scheduler_service or not scheduler_service.initialized:
         return jsonify({"error": "Scheduler not available", "schedules": []}), 503
@@ -240,13 +274,12 @@ def get_schedules():
 @app.route("/reminders", methods=["GET"])
 def get_reminders():
     """Get all reminders from reminder service."""
-    manager = get_manager()
-    reminder_service = manager.services.get("reminders")
+    reminder_service = ares.services.get("reminders")
     
     if not reminder_service or not reminder_service.initialized:
         return jsonify({"error": "Reminder system not available", "reminders": []}), 503
     
-    reminders = reminder_service.get_all_reminders()
+    reminders = reminder_service.get_reminder_list()
     return jsonify({
         "reminders": reminders,
         "count": len(reminders),
@@ -261,8 +294,7 @@ def get_reminders():
 @app.route("/voice/transcribe", methods=["POST"])
 def voice_transcribe():
     """Transcribe audio using voice service."""
-    manager = get_manager()
-    voice_service = manager.services.get("voice")
+    voice_service = ares.services.get("voice")
     
     if not voice_service or not voice_service.initialized:
         return jsonify({"error": "Voice service not available"}), 503
@@ -348,10 +380,6 @@ def serve_static(filename):
 
 def print_startup_info():
     """Print startup information."""
-    import datetime
-    
-    manager = get_manager()
-    
     print("\n" + "=" * 70)
     print("  ✅ ARES - FULLY INITIALIZED & ONLINE")
     print("=" * 70)
@@ -373,7 +401,7 @@ def print_startup_info():
     print(f"     Host: 127.0.0.1")
     print(f"     Port: 5000")
     print(f"     Debug: True")
-    print(f"     Time: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"     Time: {time.strftime('%Y-%m-%d %H:%M:%S')}")
     print()
     print("  📝 Usage:")
     print("     1. Open: http://127.0.0.1:5000/")
@@ -400,8 +428,7 @@ if __name__ == "__main__":
     
     except KeyboardInterrupt:
         print("\n\n⏹️  Shutting down ARES...")
-        manager = get_manager()
-        manager.shutdown()
+        ares.shutdown()
         print("✅ ARES shutdown complete")
         sys.exit(0)
     
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+=====================================================
+ARES - Pre-quantize Whisper
+=====================================================
+One-time conversion of openai/whisper-<size> to an int8 CTranslate2
+model under models/whisper-<size>-int8. VoiceRecognitionService loads
+that directory when it exists, so the int8 weights are read as-is
+instead of being quantized again on every start. If it is missing, the
+service loads the stock model instead; run this once (setup_whisper.bat
+does) to create it.
+
+Usage:
+    python prequantize_whisper.py [model_size]
+
+Requirements (conversion only, not needed at runtime):
+    pip install ctranslate2 transformers torch
+=====================================================
+"""
+
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+MODELS_DIR = PROJECT_ROOT / "models"
+
+
+def prequantize(model_size: str = "base") -> Optional[Path]:
+    """
+    Convert openai/whisper-<model_size> to int8 and return the output dir,
+    or None if another process is already converting it.
+    """
+    output_dir = MODELS_DIR / f"whisper-{model_size}-int8"
+    if output_dir.exists():
+        print(f"✓ Already converted: {output_dir}")
+        return output_dir
+
+    # Only one converter per model; a crashed run leaves the lock behind,
+    # delete it by hand to retry
+    MODELS_DIR.mkdir(parents=True, exist_ok=True)
+    lock_path = output_dir.with_name(output_dir.name + ".lock")
+    try:
+        os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        print(f"⚠ Conversion already in progress ({lock_path})")
+        return None
+
+    try:
+        from ctranslate2.converters import TransformersConverter
+
+        print(f"🔄 Converting openai/whisper-{model_size} to int8...")
+        # Convert next to the target and rename, so a half-written model
+        # is never picked up
+        tmp_dir = output_dir.with_name(output_dir.name + ".tmp")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        converter = TransformersConverter(
+            f"openai/whisper-{model_size}",
+            copy_files=["tokenizer.json", "preprocessor_config.json"]
+        )
+        converter.convert(str(tmp_dir), quantization="int8")
+        tmp_dir.rename(output_dir)
+        print(f"✅ Saved to {output_dir}")
+        return output_dir
+    finally:
+        lock_path.unlink()
+
+
+if __name__ == "__main__":
+    result = prequantize(sys.argv[1] if len(sys.argv) > 1 else "base")
+    sys.exit(0 if result else 1)
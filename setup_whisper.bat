@@ -21,6 +21,13 @@ echo   Testing Whisper...
 echo ================================================
 python -c "from faster_whisper import WhisperModel; print('✓ Whisper installed successfully!')"
 
+echo.
+echo ================================================
+echo   Pre-quantizing Whisper (int8, one time)...
+echo ================================================
+pip install ctranslate2 transformers torch
+python prequantize_whisper.py base
+
 echo.
 echo ================================================
 echo   Setup Complete!
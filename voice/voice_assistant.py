@@ -105,8 +105,8 @@ class AresVoiceAssistant:
         """Load AI Brain lazily"""
         if self.brain is None:
             try:
-                from ai.brain import AIBrain
-                self.brain = AIBrain()
+                from ai.brain import get_brain
+                self.brain = get_brain()
                 print("✓ AI Brain connected to Voice Assistant")
             except Exception as e:
                 print(f"⚠ Could not load AI Brain: {e}")
@@ -393,8 +393,8 @@ def create_ai_callback():
         project_root = Path(__file__).parent.parent
         sys.path.insert(0, str(project_root))
         
-        from ai.brain import AIBrain
-        brain = AIBrain()
+        from ai.brain import get_brain
+        brain = get_brain()
         print("✅ ARES Brain connected!")
         
         def callback(command):
@@ -79,8 +79,8 @@ scheduler = None
 # AI BRAIN INITIALIZATION
 # ===================================================
 try:
-    from ai.brain import AIBrain
-    brain = AIBrain()
+    from ai.brain import get_brain
+    brain = get_brain()
     COMPONENTS["ai_brain"] = True
     print("✅ AI Brain loaded successfully")
 except Exception as e: